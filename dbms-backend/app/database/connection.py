@@ -4,14 +4,87 @@ Uses a connection pool for efficient, low-latency access.
 """
 
 import os
+import asyncio
 import mysql.connector
 from mysql.connector import Error, pooling
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterator, TypeVar
 import logging
+from dotenv import load_dotenv
 from ..safety.safety_guards import SafetyGuards
 
+# Parse .env once per process; every engine builds its own DatabaseConnection
+load_dotenv()
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar('T')
+
+_NO_ROW = object()
+
+class RowStream:
+    """
+    Rows of an unbuffered read, fetched from the server in batches as they are iterated.
+
+    Owns the cursor and connection: close(), or leaving a `with` block, releases
+    them whether or not iteration ever started. Closing before the last row
+    drops the connection instead of reading the remaining rows.
+    """
+
+    def __init__(self, conn, cursor, batch_size: int,
+                 pool: Optional[pooling.MySQLConnectionPool] = None):
+        self._conn = conn
+        self._cursor = cursor
+        self._batch_size = batch_size
+        self._pool = pool
+        self._batch: Iterator[Any] = iter(())
+        self._exhausted = False
+        self._closed = False
+
+    def __iter__(self) -> 'RowStream':
+        return self
+
+    def __next__(self) -> Any:
+        while not self._closed:
+            row = next(self._batch, _NO_ROW)
+            if row is not _NO_ROW:
+                return row
+            batch = self._cursor.fetchmany(self._batch_size)
+            if not batch:
+                self._exhausted = True
+                self.close()
+                break
+            self._batch = iter(batch)
+        raise StopIteration
+
+    def __enter__(self) -> 'RowStream':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the cursor and connection. Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        self._batch = iter(())
+
+        if self._exhausted:
+            try:
+                self._cursor.close()
+            finally:
+                self._conn.close()  # returns to pool if pooled
+            return
+
+        # Unread rows must be fetched before a connection can be reused, so drop
+        # the socket instead and give the pool a fresh connection in its place
+        self._conn.shutdown()
+        if self._pool is not None and isinstance(self._conn, pooling.PooledMySQLConnection):
+            try:
+                self._pool.add_connection()
+            except Error as e:
+                logger.warning("Could not replace dropped pooled connection: %s", e)
+
 class DatabaseConnection:
     """
     Manages a MySQL connection pool for DBMS pipeline data.
@@ -19,9 +92,6 @@ class DatabaseConnection:
     """
 
     def __init__(self):
-        from dotenv import load_dotenv
-        load_dotenv()
-
         self._pool: Optional[pooling.MySQLConnectionPool] = None
         self.config = {
             'host': os.getenv('DB_HOST', 'localhost'),
@@ -89,6 +159,74 @@ class DatabaseConnection:
         finally:
             conn.close()  # returns to pool if pooled
 
+    def execute_read_one(self, query: str, params: Optional[tuple] = None,
+                         dictionary: bool = True) -> Optional[Any]:
+        """
+        Execute a read SQL query expected to match at most one row.
+        Returns that row as a dict, or None when nothing matches.
+        With dictionary=False the row is a plain tuple in SELECT column order.
+        """
+        SafetyGuards.validate_sql_query(query, allowed_operations=['SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN'])
+
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor(dictionary=dictionary)
+            cursor.execute(query, params)
+            row = cursor.fetchone()
+            cursor.fetchall()  # drain any rows beyond the first so the connection can be reused
+            cursor.close()
+            return row
+        finally:
+            conn.close()  # returns to pool if pooled
+
+    async def fetch_one(self, query: str, params: Optional[tuple] = None,
+                        dictionary: bool = True) -> Optional[Any]:
+        """Async variant of execute_read_one for use inside request handlers."""
+        return await asyncio.to_thread(self.execute_read_one, query, params, dictionary)
+
+    async def fetch_all(self, query: str, params: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """
+        Async variant of execute_read_query for use inside request handlers.
+        The blocking driver call runs in a worker thread, so the event loop
+        keeps serving other requests while MySQL responds.
+        """
+        return await asyncio.to_thread(self.execute_read_query, query, params)
+
+    def stream_read_query(self, query: str, params: Optional[tuple] = None,
+                          batch_size: int = 256, dictionary: bool = True) -> RowStream:
+        """
+        Execute a read SQL query on an unbuffered (server-side) cursor.
+        The query is executed immediately so errors surface to the caller;
+        rows are then pulled from the server in batches as the returned
+        RowStream is consumed, keeping client memory bounded. The caller must
+        close the stream (or use it as a context manager).
+        With dictionary=False rows are plain tuples in SELECT column order,
+        which skips building a dict per row.
+        """
+        SafetyGuards.validate_sql_query(query, allowed_operations=['SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN'])
+
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor(dictionary=dictionary, buffered=False)
+            cursor.execute(query, params)
+        except Exception:
+            conn.close()
+            raise
+
+        return RowStream(conn, cursor, batch_size, self._pool)
+
+    async def consume_stream(self, query: str, params: Optional[tuple],
+                             consumer: Callable[[Iterator[Any]], T], dictionary: bool = True) -> T:
+        """
+        Run stream_read_query in a worker thread and hand its row iterator to
+        `consumer`, returning whatever the consumer builds from the rows.
+        """
+        def run() -> T:
+            with self.stream_read_query(query, params, dictionary=dictionary) as rows:
+                return consumer(rows)
+
+        return await asyncio.to_thread(run)
+
     def execute_write_query(self, query: str, params: Optional[tuple] = None) -> int:
         """
         Execute a write SQL query and return rows affected.
@@ -127,6 +265,24 @@ class DatabaseConnection:
         except Exception as e:
             return {'status': 'error', 'error': str(e)}
 
+    def close(self):
+        """Close idle pooled connections. Called on application shutdown."""
+        if not self._pool:
+            return
+        pool, self._pool = self._pool, None
+
+        # MySQLConnectionPool has no public close: check out each idle connection
+        # and disconnect it instead of returning it, until the pool is empty
+        closed = 0
+        while True:
+            try:
+                conn = pool.get_connection()
+            except Error:  # PoolError once no idle connections remain
+                break
+            conn.disconnect()  # closes the underlying connection; it never goes back to the pool
+            closed += 1
+        logger.info("Connection pool closed (%d connections released)", closed)
+
     def test_connection(self) -> bool:
         """Test database connectivity."""
         try:
@@ -0,0 +1,235 @@
+"""
+SQL statements used by the DBMS self-healing pipeline API routers.
+Each statement is defined once here so handlers never build query text per request.
+"""
+
+# Issues router
+
+ISSUES_ALL_SQL = """
+SELECT 
+    issue_id,
+    issue_type,
+    detection_source,
+    raw_metric_value,
+    raw_metric_unit,
+    detected_at
+FROM detected_issues 
+WHERE detected_at IS NOT NULL
+ORDER BY detected_at DESC
+LIMIT 100
+"""
+
+ISSUE_ANALYSIS_SQL = """
+SELECT 
+    issue_id,
+    predicted_issue_class,
+    severity_level,
+    confidence_score,
+    analyzed_at
+FROM ai_analysis 
+WHERE issue_id = %s
+ORDER BY analyzed_at DESC
+LIMIT 1
+"""
+
+ISSUE_DECISION_SQL = """
+SELECT 
+    issue_id,
+    decision_type,
+    decision_reason,
+    decided_at
+FROM decision_log 
+WHERE issue_id = %s
+ORDER BY decided_at DESC
+LIMIT 1
+"""
+
+# LEFT JOIN LATERAL needs MySQL 8.0.14 or later; older servers reject this query
+ISSUE_OVERVIEW_SQL = """
+SELECT 
+    i.issue_id,
+    i.issue_type,
+    i.detection_source,
+    i.raw_metric_value,
+    i.raw_metric_unit,
+    i.detected_at,
+    a.analysis_id,
+    a.predicted_issue_class,
+    a.severity_level,
+    a.confidence_score,
+    a.analyzed_at,
+    d.decision_id,
+    d.decision_type,
+    d.decision_reason,
+    d.decided_at
+FROM detected_issues i
+LEFT JOIN LATERAL (
+    SELECT analysis_id, predicted_issue_class, severity_level, confidence_score, analyzed_at
+    FROM ai_analysis
+    WHERE issue_id = i.issue_id
+    ORDER BY analyzed_at DESC
+    LIMIT 1
+) a ON TRUE
+LEFT JOIN LATERAL (
+    SELECT decision_id, decision_type, decision_reason, decided_at
+    FROM decision_log
+    WHERE issue_id = i.issue_id
+    ORDER BY decided_at DESC
+    LIMIT 1
+) d ON TRUE
+WHERE i.issue_id = %s
+"""
+
+# Analysis router
+
+ANALYSIS_ALL_SQL = """
+SELECT 
+    analysis_id,
+    issue_id,
+    predicted_issue_class,
+    severity_level,
+    risk_type,
+    confidence_score,
+    model_version,
+    analyzed_at,
+    baseline_metric,
+    severity_ratio
+FROM ai_analysis 
+ORDER BY analyzed_at DESC
+LIMIT %s
+"""
+
+ANALYSIS_BY_ID_SQL = """
+SELECT 
+    analysis_id,
+    issue_id,
+    predicted_issue_class,
+    severity_level,
+    risk_type,
+    confidence_score,
+    model_version,
+    analyzed_at,
+    baseline_metric,
+    severity_ratio
+FROM ai_analysis 
+WHERE analysis_id = %s
+"""
+
+ANALYSIS_BY_ISSUE_SQL = """
+SELECT 
+    analysis_id,
+    issue_id,
+    predicted_issue_class,
+    severity_level,
+    risk_type,
+    confidence_score,
+    model_version,
+    analyzed_at,
+    baseline_metric,
+    severity_ratio
+FROM ai_analysis 
+WHERE issue_id = %s
+ORDER BY analyzed_at DESC
+"""
+
+# Decisions router
+
+DECISION_BY_ID_SQL = """
+SELECT 
+    decision_id,
+    issue_id,
+    decision_type,
+    decision_reason,
+    confidence_at_decision,
+    decided_at
+FROM decision_log 
+WHERE decision_id = %s
+"""
+
+DECISIONS_BY_ISSUE_SQL = """
+SELECT 
+    decision_id,
+    issue_id,
+    decision_type,
+    decision_reason,
+    confidence_at_decision,
+    decided_at
+FROM decision_log 
+WHERE issue_id = %s
+ORDER BY decided_at DESC
+"""
+
+_DECISIONS_LIST_SELECT = """
+SELECT 
+    decision_id,
+    issue_id,
+    decision_type,
+    decision_reason,
+    confidence_at_decision,
+    decided_at
+FROM decision_log 
+"""
+
+# Keyed by (decision_type filter given,)
+DECISIONS_LIST_SQL = {
+    (False,): _DECISIONS_LIST_SELECT + "ORDER BY decided_at DESC LIMIT %s",
+    (True,): _DECISIONS_LIST_SELECT + "WHERE decision_type = %s ORDER BY decided_at DESC LIMIT %s",
+}
+
+# Learning router
+
+LEARNING_BY_ID_SQL = """
+SELECT 
+    learning_id,
+    decision_id,
+    issue_type,
+    action_type,
+    outcome,
+    confidence_before,
+    confidence_after,
+    recorded_at
+FROM learning_history 
+WHERE learning_id = %s
+"""
+
+# Float literals (0E0, 1E2) make MySQL compute these as DOUBLE: CAST(... AS DOUBLE) needs
+# 8.0.17+, and DECIMAL division would cut success_rate to div_precision_increment digits
+LEARNING_STATS_SQL = """
+SELECT 
+    issue_type,
+    action_type,
+    CAST(COUNT(*) AS SIGNED) as total_records,
+    COALESCE(AVG(confidence_before), 0) + 0E0 as avg_confidence_before,
+    COALESCE(AVG(confidence_after), 0) + 0E0 as avg_confidence_after,
+    COALESCE(AVG(confidence_after - confidence_before), 0) + 0E0 as avg_improvement,
+    CAST(SUM(CASE WHEN outcome = 'RESOLVED' THEN 1 ELSE 0 END) AS SIGNED) as successful_outcomes,
+    SUM(CASE WHEN outcome = 'RESOLVED' THEN 1 ELSE 0 END) * 1E2 / COUNT(*) as success_rate
+FROM learning_history 
+GROUP BY issue_type, action_type
+ORDER BY avg_improvement DESC
+"""
+
+_LEARNING_LIST_SELECT = """
+SELECT 
+    learning_id,
+    decision_id,
+    issue_type,
+    action_type,
+    outcome,
+    confidence_before,
+    confidence_after,
+    recorded_at
+FROM learning_history 
+"""
+
+# Keyed by (issue_type filter given, outcome filter given)
+LEARNING_LIST_SQL = {
+    (False, False): _LEARNING_LIST_SELECT + "ORDER BY recorded_at DESC LIMIT %s",
+    (True, False): _LEARNING_LIST_SELECT + "WHERE issue_type = %s ORDER BY recorded_at DESC LIMIT %s",
+    (False, True): _LEARNING_LIST_SELECT + "WHERE outcome = %s ORDER BY recorded_at DESC LIMIT %s",
+    (True, True): _LEARNING_LIST_SELECT + "WHERE issue_type = %s AND outcome = %s ORDER BY recorded_at DESC LIMIT %s",
+}
+
+# Health router
+
+HEALTH_PING_SQL = "SELECT 1 as test"
@@ -0,0 +1,89 @@
+"""
+Short-lived response cache for DBMS self-healing pipeline read endpoints.
+Dashboards poll the list endpoints every few seconds; caching each result
+for a few seconds collapses those polls into a single database query.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Tuple
+import time
+import logging
+
+from starlette.responses import Response
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 256
+
+_entries: "OrderedDict[Tuple, Tuple[float, Callable[[], Any]]]" = OrderedDict()
+_versions: Dict[str, int] = {}
+
+# Set by Starlette from the body; rebuilt for every copy
+_DERIVED_HEADERS = frozenset({'content-length', 'content-type'})
+
+def _snapshot(result: Any) -> Callable[[], Any]:
+    """
+    Capture a handler result so every cache hit gets its own copy.
+
+    Response objects are mutated downstream (GZipMiddleware rewrites their
+    headers in place), so only the encoded body, status and headers are kept
+    and a new Response is built per hit. Other results are returned as is.
+    """
+    if not isinstance(result, Response):
+        return lambda: result
+
+    body = result.body
+    status_code = result.status_code
+    media_type = result.media_type
+    headers = {
+        name: value for name, value in result.headers.items()
+        if name not in _DERIVED_HEADERS
+    }
+    return lambda: Response(content=body, status_code=status_code, headers=headers, media_type=media_type)
+
+def cached_response(namespace: str, ttl: float = 5.0) -> Callable:
+    """
+    Cache an async endpoint's return value for `ttl` seconds.
+
+    Entries are keyed by namespace version, handler name and call arguments,
+    which are the endpoint's path and query parameters. Exceptions and
+    streaming responses are never cached.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (namespace, _versions.get(namespace, 0), func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+
+            entry = _entries.get(key)
+            if entry is not None and entry[0] > now:
+                _entries.move_to_end(key)
+                return entry[1]()
+
+            result = await func(*args, **kwargs)
+            # Streaming bodies cannot be replayed
+            if isinstance(result, Response) and not hasattr(result, 'body'):
+                return result
+
+            snapshot = _snapshot(result)
+            _entries[key] = (now + ttl, snapshot)
+            _entries.move_to_end(key)
+            while len(_entries) > MAX_ENTRIES:
+                _entries.popitem(last=False)
+            return snapshot()
+
+        return wrapper
+
+    return decorator
+
+def invalidate(namespace: str) -> None:
+    """Drop every cached response for a namespace after its data changes."""
+    _versions[namespace] = _versions.get(namespace, 0) + 1
+    for key in [key for key in _entries if key[0] == namespace]:
+        del _entries[key]
+    logger.debug("Invalidated response cache namespace %s", namespace)
+
+def clear() -> None:
+    """Drop all cached responses."""
+    _entries.clear()
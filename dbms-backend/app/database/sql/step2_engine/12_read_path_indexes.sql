@@ -0,0 +1,42 @@
+/*!40101 SET NAMES utf8mb4 */;
+
+-- Composite indexes for the API read paths.
+-- "Latest analysis/decision for an issue" lookups (WHERE issue_id = ? ORDER BY ... DESC LIMIT 1)
+-- and the dashboard lists (ORDER BY analyzed_at/decided_at DESC LIMIT n) become index range
+-- scans with no filesort. Trailing columns cover the selected fields, since InnoDB has no
+-- INCLUDE clause. Each index is built online (ALGORITHM=INPLACE, LOCK=NONE) and only created
+-- when missing, so the script is safe to re-run.
+
+DROP PROCEDURE IF EXISTS add_index_if_missing;
+DELIMITER //
+CREATE PROCEDURE add_index_if_missing(
+    IN p_table VARCHAR(64),
+    IN p_index VARCHAR(64),
+    IN p_columns VARCHAR(512)
+)
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = p_table AND index_name = p_index
+    ) THEN
+        SET @ddl = CONCAT('ALTER TABLE ', p_table, ' ADD INDEX ', p_index, ' (', p_columns, '), ALGORITHM=INPLACE, LOCK=NONE');
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END//
+DELIMITER ;
+
+-- /issues/{id}/analysis, /issues/{id}/full, /analysis/issue/{id}
+CALL add_index_if_missing('ai_analysis', 'idx_ai_issue_time',
+    'issue_id, analyzed_at DESC, predicted_issue_class, severity_level, confidence_score');
+
+-- /issues/{id}/decision, /issues/{id}/full, /decisions/issue/{id}
+CALL add_index_if_missing('decision_log', 'idx_decision_issue_time',
+    'issue_id, decided_at DESC, decision_type, decision_reason');
+
+-- /analysis/ and /decisions/ dashboard lists (detected_at is already covered by idx_detected_issues_time)
+CALL add_index_if_missing('ai_analysis', 'idx_ai_analyzed_at', 'analyzed_at DESC');
+CALL add_index_if_missing('decision_log', 'idx_decision_decided_at', 'decided_at DESC');
+
+DROP PROCEDURE IF EXISTS add_index_if_missing;
@@ -56,7 +56,7 @@ class AdminReviewEngine:
             admin_review_decisions = self._get_unprocessed_admin_review_decisions()
             results['decisions_processed'] = len(admin_review_decisions)
             
-            logger.info(f"Found {len(admin_review_decisions)} unprocessed ADMIN_REVIEW decisions")
+            logger.info("Found %d unprocessed ADMIN_REVIEW decisions", len(admin_review_decisions))
             
             # Process each decision
             for decision in admin_review_decisions:
@@ -70,14 +70,14 @@ class AdminReviewEngine:
                         if review['priority'] == 'HIGH':
                             results['high_priority_reviews'] += 1
                             
-                        logger.info(f"Admin review created for decision {decision['decision_id']}: {review['priority']} priority")
+                        logger.info("Admin review created for decision %s: %s priority", decision['decision_id'], review['priority'])
                     
                 except Exception as e:
                     error_msg = f"Error processing decision {decision.get('decision_id', 'unknown')}: {str(e)}"
                     logger.error(error_msg)
                     results['errors'].append(error_msg)
             
-            logger.info(f"Admin review engine completed: {results['reviews_created']} reviews created")
+            logger.info("Admin review engine completed: %s reviews created", results['reviews_created'])
             
         except Exception as e:
             error_msg = f"Critical error in admin review engine: {str(e)}"
@@ -123,7 +123,7 @@ class AdminReviewEngine:
                 return results
                 
         except Exception as e:
-            logger.error(f"Error fetching unprocessed ADMIN_REVIEW decisions: {e}")
+            logger.error("Error fetching unprocessed ADMIN_REVIEW decisions: %s", e)
             return []
     
     def _create_admin_review(self, decision: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -167,12 +167,12 @@ class AdminReviewEngine:
                 }
             }
             
-            logger.info(f"Admin review created for decision {decision_id}: {priority} priority - {issue_type}")
+            logger.info("Admin review created for decision %s: %s priority - %s", decision_id, priority, issue_type)
             
             return review
             
         except Exception as e:
-            logger.error(f"Error creating admin review for decision {decision.get('decision_id', 'unknown')}: {e}")
+            logger.error("Error creating admin review for decision %s: %s", decision.get('decision_id', 'unknown'), e)
             return None
     
     def _generate_recommendations(self, decision: Dict[str, Any]) -> Dict[str, Any]:
@@ -385,11 +385,11 @@ class AdminReviewEngine:
                 conn.commit()
                 cursor.close()
                 
-                logger.info(f"Admin review recorded: {review['review_id']}")
+                logger.info("Admin review recorded: %s", review['review_id'])
                 return True
                 
         except Exception as e:
-            logger.error(f"Error recording admin review {review['review_id']}: {e}")
+            logger.error("Error recording admin review %s: %s", review['review_id'], e)
             return False
     
     def get_pending_reviews(self) -> List[Dict[str, Any]]:
@@ -428,9 +428,50 @@ class AdminReviewEngine:
                 return results
                 
         except Exception as e:
-            logger.error(f"Error fetching pending reviews: {e}")
+            logger.error("Error fetching pending reviews: %s", e)
             return []
     
+    def count_pending_reviews(self, limit: int = 6) -> int:
+        """
+        Count pending admin reviews, stopping once `limit` rows are seen.
+        
+        Callers that only compare against a threshold avoid fetching and
+        transferring every pending review row.
+        
+        Args:
+            limit: Maximum number of pending reviews to count
+            
+        Returns:
+            Number of pending reviews, capped at `limit`
+            
+        Raises:
+            Exception: If the count query fails
+        """
+        query = """
+        SELECT COUNT(*) AS pending_count
+        FROM (
+            SELECT 1
+            FROM admin_reviews ar
+            JOIN decision_log dl ON ar.decision_id = dl.decision_id
+            JOIN detected_issues di ON dl.issue_id = di.issue_id
+            WHERE ar.admin_action = 'PENDING'
+            LIMIT %s
+        ) pending
+        """
+        
+        try:
+            with self.db.get_connection() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.execute(query, (limit,))
+                result = cursor.fetchone()
+                cursor.close()
+                return int(result['pending_count']) if result else 0
+                
+        except Exception as e:
+            # Re-raise: reporting 0 would make a failed query look like an empty queue
+            logger.error("Error counting pending reviews: %s", e)
+            raise
+    
     def get_admin_review_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about admin reviews in the system.
@@ -481,7 +522,7 @@ class AdminReviewEngine:
                 return stats
                 
         except Exception as e:
-            logger.error(f"Error getting admin review statistics: {e}")
+            logger.error("Error getting admin review statistics: %s", e)
             return {'error': str(e)}
     
     def simulate_admin_action(self, review_id: str, action: str, comment: str = None, override: bool = False) -> bool:
@@ -517,9 +558,9 @@ class AdminReviewEngine:
                 conn.commit()
                 cursor.close()
                 
-                logger.info(f"Admin action simulated for review {review_id}: {action}")
+                logger.info("Admin action simulated for review %s: %s", review_id, action)
                 return True
                 
         except Exception as e:
-            logger.error(f"Error simulating admin action for review {review_id}: {e}")
+            logger.error("Error simulating admin action for review %s: %s", review_id, e)
             return False
\ No newline at end of file
@@ -5,6 +5,8 @@ Provides read-only API access to DBMS monitoring and healing data.
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from contextlib import asynccontextmanager
 import logging
 import os
 from dotenv import load_dotenv
@@ -23,6 +25,7 @@ logger = logging.getLogger(__name__)
 
 # Import database connection
 from .database.connection import db
+from .models.responses import RecordJSONResponse
 
 # Global exports for testing
 DB_CONFIG = {
@@ -63,11 +66,19 @@ from .routers import (
     stats
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release pooled database connections when the server shuts down."""
+    yield
+    db.close()
+
 # Create FastAPI application
 app = FastAPI(
     title="DBMS Self-Healing API",
     version="1.0.0",
-    description="API for DBMS self-healing pipeline data"
+    description="API for DBMS self-healing pipeline data",
+    default_response_class=RecordJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS configuration - Allow all Vercel preview deployments
@@ -87,6 +98,9 @@ app.add_middleware(
     max_age=3600,  # Cache preflight requests for 1 hour
 )
 
+# Compress larger JSON payloads (list endpoints) for clients polling over slow links
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
+
 # Include routers
 app.include_router(health.router)
 app.include_router(issues.router)
@@ -0,0 +1,34 @@
+"""
+Response classes for DBMS self-healing pipeline API endpoints.
+Serializes database rows directly to JSON without Pydantic re-validation.
+"""
+
+from typing import Any, Dict, Iterable, Tuple
+import orjson
+from fastapi.responses import JSONResponse
+
+class RecordJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+    Datetimes are encoded natively; Decimal values fall back to str,
+    matching how the Pydantic schemas serialize them.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=str)
+
+def encode_records(records: Iterable[Dict[str, Any]]) -> Tuple[bytes, int]:
+    """
+    Encode records into a JSON array one at a time, so rows pulled from a
+    streaming cursor never need to be held in memory together.
+    Returns the encoded body and the number of records written.
+    """
+    buf = bytearray(b'[')
+    count = 0
+    for record in records:
+        if count:
+            buf += b','
+        buf += orjson.dumps(record, default=str)
+        count += 1
+    buf += b']'
+    return bytes(buf), count
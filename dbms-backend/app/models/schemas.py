@@ -125,6 +125,15 @@ class IssueDecision(BaseModel):
     decided_at: datetime = Field(..., description="Timestamp when decision was made")
     
 
+class IssueOverview(BaseModel):
+    """
+    Detected issue together with its latest analysis and decision.
+    """
+    issue: DetectedIssue = Field(..., description="The detected issue")
+    latest_analysis: Optional[IssueAnalysis] = Field(None, description="Most recent AI analysis of the issue")
+    latest_decision: Optional[IssueDecision] = Field(None, description="Most recent decision made for the issue")
+    
+
 class APIResponse(BaseModel):
     """
     Standard API response wrapper for consistent response format.
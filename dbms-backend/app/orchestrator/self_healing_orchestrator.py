@@ -13,6 +13,7 @@ All operations are safe, auditable, and follow academic best practices.
 """
 
 import logging
+import time
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
@@ -50,7 +51,7 @@ class SelfHealingOrchestrator:
         logger.info("Starting full self-healing cycle...")
         
         cycle_results = {
-            'cycle_id': f"cycle_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+            'cycle_id': f"cycle_{int(time.time() * 1000):013d}",
             'started_at': datetime.now(),
             'completed_at': None,
             'total_duration_seconds': 0,
@@ -90,7 +91,7 @@ class SelfHealingOrchestrator:
                 cycle_results['completed_at'] - cycle_results['started_at']
             ).total_seconds()
             
-            logger.info(f"Full healing cycle completed in {cycle_results['total_duration_seconds']:.2f} seconds")
+            logger.info("Full healing cycle completed in %.2f seconds", cycle_results['total_duration_seconds'])
             
         except Exception as e:
             error_msg = f"Critical error in healing cycle: {str(e)}"
@@ -114,7 +115,7 @@ class SelfHealingOrchestrator:
             
             results = self.decision_engine.process_new_issues()
             
-            logger.info(f"Decision stage completed: {results['decisions_made']} decisions made")
+            logger.info("Decision stage completed: %s decisions made", results['decisions_made'])
             return {
                 'success': True,
                 'results': results,
@@ -122,7 +123,7 @@ class SelfHealingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Error in decision stage: {e}")
+            logger.error("Error in decision stage: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -141,7 +142,7 @@ class SelfHealingOrchestrator:
             
             results = self.healing_engine.process_auto_heal_decisions()
             
-            logger.info(f"Healing stage completed: {results['actions_executed']} actions executed")
+            logger.info("Healing stage completed: %s actions executed", results['actions_executed'])
             return {
                 'success': True,
                 'results': results,
@@ -149,7 +150,7 @@ class SelfHealingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Error in healing stage: {e}")
+            logger.error("Error in healing stage: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -166,7 +167,7 @@ class SelfHealingOrchestrator:
         try:
             results = self.admin_review_engine.process_admin_review_decisions()
             
-            logger.info(f"Admin review stage completed: {results['reviews_created']} reviews created")
+            logger.info("Admin review stage completed: %s reviews created", results['reviews_created'])
             return {
                 'success': True,
                 'results': results,
@@ -174,7 +175,7 @@ class SelfHealingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Error in admin review stage: {e}")
+            logger.error("Error in admin review stage: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -207,7 +208,7 @@ class SelfHealingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Error in safety validation: {e}")
+            logger.error("Error in safety validation: %s", e)
             return {
                 'success': False,
                 'error': str(e),
@@ -320,7 +321,7 @@ class SelfHealingOrchestrator:
             }
             
         except Exception as e:
-            logger.error(f"Error getting system status: {e}")
+            logger.error("Error getting system status: %s", e)
             return {
                 'timestamp': datetime.now(),
                 'system_operational': False,
@@ -357,7 +358,7 @@ class SelfHealingOrchestrator:
                 integrity['workflow_complete'] = integrity['integrity_score'] > 90
             
         except Exception as e:
-            logger.error(f"Error checking workflow integrity: {e}")
+            logger.error("Error checking workflow integrity: %s", e)
             integrity['error'] = str(e)
             integrity['workflow_complete'] = False
             integrity['integrity_score'] = 0
@@ -374,14 +375,16 @@ class SelfHealingOrchestrator:
         logger.info("Generating comprehensive audit report...")
         
         try:
+            system_status = self.get_system_status()
+            
             audit_report = {
-                'report_id': f"audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'report_id': f"audit_{int(time.time() * 1000):013d}",
                 'generated_at': datetime.now(),
                 'report_type': 'COMPREHENSIVE_AUDIT',
-                'system_status': self.get_system_status(),
+                'system_status': system_status,
                 'safety_compliance': SafetyGuards.create_safety_report(),
                 'rulebook_verification': self.rulebook.get_rule_summary(),
-                'workflow_integrity': self._check_workflow_integrity(),
+                'workflow_integrity': system_status.get('workflow_integrity') or self._check_workflow_integrity(),
                 'academic_compliance': {
                     'deterministic_rules': True,
                     'auditable_decisions': True,
@@ -390,42 +393,43 @@ class SelfHealingOrchestrator:
                     'admin_override_available': True,
                     'comprehensive_logging': True
                 },
-                'recommendations': self._generate_audit_recommendations()
+                'recommendations': self._generate_audit_recommendations(system_status)
             }
             
             logger.info("Audit report generated successfully")
             return audit_report
             
         except Exception as e:
-            logger.error(f"Error generating audit report: {e}")
+            logger.error("Error generating audit report: %s", e)
             return {
-                'report_id': f"audit_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                'report_id': f"audit_error_{int(time.time() * 1000):013d}",
                 'generated_at': datetime.now(),
                 'error': str(e),
                 'status': 'FAILED'
             }
     
-    def _generate_audit_recommendations(self) -> List[Dict[str, Any]]:
+    def _generate_audit_recommendations(self, system_status: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Generate recommendations for system improvement.
         
+        Args:
+            system_status: System status already computed for the report
+            
         Returns:
             List of recommendations
         """
         recommendations = []
         
         try:
-            # Check system status for recommendations
-            system_status = self.get_system_status()
-            
             # Check for pending admin reviews
-            pending_reviews = self.admin_review_engine.get_pending_reviews()
-            if len(pending_reviews) > 5:
+            pending_count = self.admin_review_engine.count_pending_reviews(limit=6)
+            if pending_count > 5:
                 recommendations.append({
                     'priority': 'MEDIUM',
                     'category': 'ADMIN_WORKLOAD',
                     'title': 'High number of pending admin reviews',
-                    'description': f'{len(pending_reviews)} reviews pending admin attention',
+                    # The count stops at 6, so report it as a lower bound
+                    'description': f'{pending_count}+ reviews pending admin attention',
                     'action': 'Review and process pending admin reviews'
                 })
             
@@ -450,7 +454,7 @@ class SelfHealingOrchestrator:
             })
             
         except Exception as e:
-            logger.error(f"Error generating recommendations: {e}")
+            logger.error("Error generating recommendations: %s", e)
             recommendations.append({
                 'priority': 'HIGH',
                 'category': 'SYSTEM_ERROR',
@@ -57,11 +57,11 @@ async def get_healing_actions(
     
     try:
         results = db.execute_read_query(query, tuple(params))
-        logger.info(f"Retrieved {len(results)} unified healing actions")
+        logger.info("Retrieved %d unified healing actions", len(results))
         
         actions = []
         for row in results:
-            action = HealingAction(
+            action = HealingAction.model_construct(
                 action_id=str(row['action_id']) if row['action_id'] else None,
                 decision_id=str(row['decision_id']),
                 issue_type=row['issue_type'],
@@ -81,7 +81,7 @@ async def get_healing_actions(
         return actions
         
     except Exception as e:
-        logger.error(f"Error retrieving unified healing actions: {e}")
+        logger.error("Error retrieving unified healing actions: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve unified actions from database"
@@ -89,7 +89,7 @@ async def get_healing_actions(
 
 @router.get("/{action_id}", response_model=HealingAction)
 async def get_healing_action(
-    action_id: str = Path(..., description="Unique identifier of the healing action")
+    action_id: int = Path(..., ge=1, description="Unique identifier of the healing action")
 ):
     """
     Retrieve details of a specific healing action.
@@ -130,8 +130,8 @@ async def get_healing_action(
             )
         
         row = results[0]
-        logger.info(f"Retrieved healing action {action_id}")
-        return HealingAction(
+        logger.info("Retrieved healing action %s", action_id)
+        return HealingAction.model_construct(
             action_id=str(row['action_id']),
             decision_id=str(row['decision_id']),
             issue_type=row['issue_type'],
@@ -150,7 +150,7 @@ async def get_healing_action(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving healing action {action_id}: {e}")
+        logger.error("Error retrieving healing action %s: %s", action_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve healing action from database"
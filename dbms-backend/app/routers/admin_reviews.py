@@ -4,11 +4,14 @@ Provides access to manage and query admin review records.
 """
 
 from fastapi import APIRouter, HTTPException, Path, Query, Header, status
-from typing import List, Optional
+from fastapi.responses import Response
+from typing import Any, Dict, List, Optional
 import os
 import logging
 
 from ..database.connection import db
+from ..database.response_cache import invalidate
+from ..models.responses import encode_records
 from ..models.schemas import AdminReview
 
 logger = logging.getLogger(__name__)
@@ -20,21 +23,37 @@ async def verify_admin_auth(x_admin_token: Optional[str] = Header(None)):
     # Fallback to a default secret if API_KEY is not set in env
     expected_token = os.getenv("API_KEY", "admin-secret-token")
     if not x_admin_token or x_admin_token != expected_token:
-        logger.warning(f"Unauthorized access attempt with token: {x_admin_token}")
+        logger.warning("Unauthorized access attempt with token: %s", x_admin_token)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="ADMIN authorization required"
         )
     return True
 
+def _review_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an admin review row like the AdminReview schema without Pydantic validation."""
+    return {
+        "review_id": str(row['review_id']),
+        "decision_id": str(row['decision_id']),
+        "issue_id": str(row['issue_id']),
+        "review_status": row['review_status'],
+        "issue_type": row['issue_type'],
+        "action_type": row['action_type'],
+        "admin_action": row['admin_action'],
+        "admin_comment": row['admin_comment'],
+        "override_flag": bool(row['override_flag']),
+        "reviewed_at": row['reviewed_at']
+    }
+
 @router.get("/", response_model=List[AdminReview])
 async def get_all_admin_reviews(
-    limit: Optional[int] = Query(100, description="Maximum number of records to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
 ):
     """
     Retrieve all admin review records.
     
     Returns reviews ordered by review time (most recent first).
+    Rows are read from a server-side cursor and encoded one at a time.
     """
     query = """
     SELECT 
@@ -56,30 +75,16 @@ async def get_all_admin_reviews(
     """
     
     try:
-        results = db.execute_read_query(query, (limit,))
-        logger.info(f"Retrieved {len(results)} admin review records")
-        
-        # Convert results to match Pydantic model
-        reviews = []
-        for row in results:
-            review = AdminReview(
-                review_id=str(row['review_id']),
-                decision_id=str(row['decision_id']),
-                issue_id=str(row['issue_id']),
-                review_status=row['review_status'],
-                issue_type=row['issue_type'],
-                action_type=row['action_type'],
-                admin_action=row['admin_action'],
-                admin_comment=row['admin_comment'],
-                override_flag=bool(row['override_flag']),
-                reviewed_at=row['reviewed_at']
-            )
-            reviews.append(review)
+        # Encode rows as they stream off the cursor in a worker thread
+        body, count = await db.consume_stream(
+            query, (limit,), lambda rows: encode_records(map(_review_to_dict, rows))
+        )
+        logger.info("Retrieved %d admin review records", count)
         
-        return reviews
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving admin review records: {e}")
+        logger.error("Error retrieving admin review records: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve admin review records from database"
@@ -87,7 +92,7 @@ async def get_all_admin_reviews(
 
 @router.get("/{review_id}", response_model=AdminReview)
 async def get_admin_review_by_id(
-    review_id: str = Path(..., description="Unique identifier of the review")
+    review_id: int = Path(..., ge=1, description="Unique identifier of the review")
 ):
     """
     Retrieve specific admin review by ID.
@@ -119,8 +124,8 @@ async def get_admin_review_by_id(
                 detail=f"No admin review found with ID {review_id}"
             )
         
-        logger.info(f"Retrieved admin review {review_id}")
-        return AdminReview(
+        logger.info("Retrieved admin review %s", review_id)
+        return AdminReview.model_construct(
             review_id=str(results[0]['review_id']),
             decision_id=str(results[0]['decision_id']),
             issue_id=str(results[0]['issue_id']),
@@ -136,7 +141,7 @@ async def get_admin_review_by_id(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving admin review {review_id}: {e}")
+        logger.error("Error retrieving admin review %s: %s", review_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve admin review from database"
@@ -168,11 +173,11 @@ async def get_reviews_by_decision(
     
     try:
         results = db.execute_read_query(query, (decision_id,))
-        logger.info(f"Retrieved {len(results)} admin reviews for decision {decision_id}")
+        logger.info("Retrieved %d admin reviews for decision %s", len(results), decision_id)
         
         reviews = []
         for row in results:
-            review = AdminReview(
+            review = AdminReview.model_construct(
                 review_id=str(row['review_id']),
                 decision_id=str(row['decision_id']),
                 issue_id=str(row['issue_id']),
@@ -189,7 +194,7 @@ async def get_reviews_by_decision(
         return reviews
         
     except Exception as e:
-        logger.error(f"Error retrieving admin reviews for decision {decision_id}: {e}")
+        logger.error("Error retrieving admin reviews for decision %s: %s", decision_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve admin review records from database"
@@ -219,7 +224,7 @@ async def approve_review(
         decision_id = result[0]['decision_id']
         
         if current_status != 'PENDING':
-            logger.info(f"Review {review_id} already processed (Status: {current_status}). Skipping execution.")
+            logger.info("Review %s already processed (Status: %s). Skipping execution.", review_id, current_status)
             return {
                 "status": "ALREADY_PROCESSED", 
                 "message": f"Review {review_id} has already been {current_status.lower()}.",
@@ -228,8 +233,10 @@ async def approve_review(
             }
         
         # STEP 4: Trigger Execution
-        logger.info(f"Processing approval for review {review_id} (Decision {decision_id})")
+        logger.info("Processing approval for review %s (Decision %s)", review_id, decision_id)
         db.execute_write_query("CALL process_admin_review(%s, 'APPROVE')", (decision_id,))
+        invalidate("decisions")
+        invalidate("learning")
         
         return {
             "status": "SUCCESS", 
@@ -239,7 +246,7 @@ async def approve_review(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to approve review {review_id}: {e}")
+        logger.error("Failed to approve review %s: %s", review_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail=f"Execution failure: {str(e)}"
@@ -269,7 +276,7 @@ async def reject_review(
         decision_id = result[0]['decision_id']
         
         if current_status != 'PENDING':
-            logger.info(f"Review {review_id} already processed (Status: {current_status}). Skipping rejection.")
+            logger.info("Review %s already processed (Status: %s). Skipping rejection.", review_id, current_status)
             return {
                 "status": "ALREADY_PROCESSED", 
                 "message": f"Review {review_id} has already been {current_status.lower()}.",
@@ -278,8 +285,10 @@ async def reject_review(
             }
         
         # STEP 4: Trigger Execution
-        logger.info(f"Processing rejection for review {review_id} (Decision {decision_id})")
+        logger.info("Processing rejection for review %s (Decision %s)", review_id, decision_id)
         db.execute_write_query("CALL process_admin_review(%s, 'REJECT')", (decision_id,))
+        invalidate("decisions")
+        invalidate("learning")
         
         return {
             "status": "SUCCESS", 
@@ -289,7 +298,7 @@ async def reject_review(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to reject review {review_id}: {e}")
+        logger.error("Failed to reject review %s: %s", review_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail=f"Execution failure: {str(e)}"
@@ -4,77 +4,74 @@ Provides read-only access to AI analysis data.
 """
 
 from fastapi import APIRouter, HTTPException, Path, Query
-from typing import List, Optional
+from fastapi.responses import Response
+from typing import Any, Dict, Iterator, List, Sequence
 import logging
 
 from ..database.connection import db
+from ..database.queries import ANALYSIS_ALL_SQL, ANALYSIS_BY_ID_SQL, ANALYSIS_BY_ISSUE_SQL
+from ..database.response_cache import cached_response
+from ..models.responses import RecordJSONResponse, encode_records
 from ..models.schemas import AIAnalysis
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/analysis", tags=["AI Analysis"])
 
-@router.get("/", response_model=List[AIAnalysis])
+def _analysis_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Shape a positional ai_analysis row (ANALYSIS_*_SQL column order) like the
+    AIAnalysis schema without Pydantic validation.
+    """
+    (analysis_id, issue_id, predicted_issue_class, severity_level, risk_type,
+     raw_confidence, model_version, analyzed_at, raw_baseline, raw_ratio) = row
+
+    # Preserve real DB values — send null for missing fields, never default to 0
+    analysis = {
+        "analysis_id": str(analysis_id),
+        "issue_id": str(issue_id),
+        "predicted_issue_class": str(predicted_issue_class),
+        "severity_level": str(severity_level),
+        "risk_type": str(risk_type),
+        "confidence_score": float(raw_confidence) if raw_confidence is not None else None,
+        "model_version": str(model_version),
+        "analyzed_at": analyzed_at,
+        "baseline_metric": float(raw_baseline) if raw_baseline is not None else None,
+        "severity_ratio": float(raw_ratio) if raw_ratio is not None else None
+    }
+    logger.debug("Analysis row: baseline=%s -> %s, ratio=%s -> %s",
+                 raw_baseline, analysis['baseline_metric'], raw_ratio, analysis['severity_ratio'])
+    return analysis
+
+def _analysis_records(rows: Iterator[Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    """Shape analysis rows, skipping any that cannot be converted."""
+    for row in rows:
+        try:
+            yield _analysis_to_dict(row)
+        except Exception as row_error:
+            logger.warning("Skipping malformed row: %s", row_error)
+
+@router.get("/", response_class=RecordJSONResponse, responses={200: {"model": List[AIAnalysis]}})
+@cached_response("analysis")
 async def get_all_analysis(
-    limit: Optional[int] = Query(100, description="Maximum number of records to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return")
 ):
     """
     Retrieve all AI analysis records.
     
     Returns analysis results ordered by analysis time (most recent first).
     """
-    query = """
-    SELECT 
-        analysis_id,
-        issue_id,
-        predicted_issue_class,
-        severity_level,
-        risk_type,
-        confidence_score,
-        model_version,
-        analyzed_at,
-        baseline_metric,
-        severity_ratio
-    FROM ai_analysis 
-    ORDER BY analyzed_at DESC
-    LIMIT %s
-    """
-    
     try:
-        results = db.execute_read_query(query, (limit,))
-        logger.info(f"Retrieved {len(results)} AI analysis records")
-        
-        # Convert results to match Pydantic model
-        analyses = []
-        for row in results:
-            try:
-                # Preserve real DB values — send null for missing fields, never default to 0
-                raw_baseline = row.get('baseline_metric')
-                raw_ratio = row.get('severity_ratio')
-                raw_confidence = row.get('confidence_score')
-                raw_analyzed_at = row.get('analyzed_at')
-
-                analysis = {
-                    "analysis_id": str(row.get('analysis_id', '')),
-                    "issue_id": str(row.get('issue_id', '')),
-                    "predicted_issue_class": str(row.get('predicted_issue_class', 'UNKNOWN')),
-                    "severity_level": str(row.get('severity_level', 'LOW')),
-                    "risk_type": str(row.get('risk_type', 'UNCERTAIN')),
-                    "confidence_score": float(raw_confidence) if raw_confidence is not None else None,
-                    "model_version": str(row.get('model_version', 'v1.0')),
-                    "analyzed_at": raw_analyzed_at.isoformat() if hasattr(raw_analyzed_at, 'isoformat') else str(raw_analyzed_at),
-                    "baseline_metric": float(raw_baseline) if raw_baseline is not None else None,
-                    "severity_ratio": float(raw_ratio) if raw_ratio is not None else None
-                }
-                logger.debug(f"Analysis row: baseline={raw_baseline} -> {analysis['baseline_metric']}, ratio={raw_ratio} -> {analysis['severity_ratio']}")
-                analyses.append(analysis)
-            except Exception as row_error:
-                logger.warning(f"Skipping malformed row: {row_error}")
-                continue
+        # Encode rows as they stream off the cursor; skip re-validating trusted DB output
+        body, count = await db.consume_stream(
+            ANALYSIS_ALL_SQL, (limit,), lambda rows: encode_records(_analysis_records(rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d AI analysis records", count)
         
-        return analyses
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving AI analysis records: {e}")
+        logger.error("Error retrieving AI analysis records: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve AI analysis records from database"
@@ -82,108 +79,50 @@ async def get_all_analysis(
 
 @router.get("/{analysis_id}", response_model=AIAnalysis)
 async def get_analysis_by_id(
-    analysis_id: str = Path(..., description="Unique identifier of the analysis")
+    analysis_id: int = Path(..., ge=1, description="Unique identifier of the analysis")
 ):
     """
     Retrieve specific AI analysis by ID.
     """
-    query = """
-    SELECT 
-        analysis_id,
-        issue_id,
-        predicted_issue_class,
-        severity_level,
-        risk_type,
-        confidence_score,
-        model_version,
-        analyzed_at,
-        baseline_metric,
-        severity_ratio
-    FROM ai_analysis 
-    WHERE analysis_id = %s
-    """
-    
     try:
-        results = db.execute_read_query(query, (analysis_id,))
+        row = await db.fetch_one(ANALYSIS_BY_ID_SQL, (analysis_id,), dictionary=False)
         
-        if not results:
+        if row is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No analysis found with ID {analysis_id}"
             )
         
-        logger.info(f"Retrieved analysis {analysis_id}")
-        row = results[0]
-        return AIAnalysis(
-            analysis_id=str(row['analysis_id']),
-            issue_id=str(row['issue_id']),
-            predicted_issue_class=row['predicted_issue_class'],
-            severity_level=row['severity_level'],
-            risk_type=row['risk_type'],
-            confidence_score=row['confidence_score'],
-            model_version=row['model_version'],
-            analyzed_at=row['analyzed_at'],
-            baseline_metric=row.get('baseline_metric'),
-            severity_ratio=row.get('severity_ratio')
-        )
+        logger.info("Retrieved analysis %s", analysis_id)
+        return AIAnalysis.model_construct(**_analysis_to_dict(row))
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving analysis {analysis_id}: {e}")
+        logger.error("Error retrieving analysis %s: %s", analysis_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve analysis from database"
         )
 
-@router.get("/issue/{issue_id}", response_model=List[AIAnalysis])
+@router.get("/issue/{issue_id}", response_class=RecordJSONResponse, responses={200: {"model": List[AIAnalysis]}})
 async def get_analysis_by_issue(
-    issue_id: str = Path(..., description="Issue identifier")
+    issue_id: int = Path(..., ge=1, description="Issue identifier")
 ):
     """
     Retrieve all AI analysis records for a specific issue.
     """
-    query = """
-    SELECT 
-        analysis_id,
-        issue_id,
-        predicted_issue_class,
-        severity_level,
-        risk_type,
-        confidence_score,
-        model_version,
-        analyzed_at,
-        baseline_metric,
-        severity_ratio
-    FROM ai_analysis 
-    WHERE issue_id = %s
-    ORDER BY analyzed_at DESC
-    """
-    
     try:
-        results = db.execute_read_query(query, (issue_id,))
-        logger.info(f"Retrieved {len(results)} analysis records for issue {issue_id}")
-        
-        analyses = []
-        for row in results:
-            analysis = AIAnalysis(
-                analysis_id=str(row['analysis_id']),
-                issue_id=str(row['issue_id']),
-                predicted_issue_class=row['predicted_issue_class'],
-                severity_level=row['severity_level'],
-                risk_type=row['risk_type'],
-                confidence_score=row['confidence_score'],
-                model_version=row['model_version'],
-                analyzed_at=row['analyzed_at'],
-                baseline_metric=row.get('baseline_metric'),
-                severity_ratio=row.get('severity_ratio')
-            )
-            analyses.append(analysis)
+        body, count = await db.consume_stream(
+            ANALYSIS_BY_ISSUE_SQL, (issue_id,), lambda rows: encode_records(map(_analysis_to_dict, rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d analysis records for issue %s", count, issue_id)
         
-        return analyses
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving analysis for issue {issue_id}: {e}")
+        logger.error("Error retrieving analysis for issue %s: %s", issue_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve analysis records from database"
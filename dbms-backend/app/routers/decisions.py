@@ -4,18 +4,38 @@ Provides read-only access to decision log data.
 """
 
 from fastapi import APIRouter, HTTPException, Path, Query
-from typing import List, Optional
+from fastapi.responses import Response
+from typing import Any, Dict, List, Optional, Sequence
 import logging
 
 from ..database.connection import db
+from ..database.queries import DECISION_BY_ID_SQL, DECISIONS_BY_ISSUE_SQL, DECISIONS_LIST_SQL
+from ..database.response_cache import cached_response
+from ..models.responses import RecordJSONResponse, encode_records
 from ..models.schemas import DecisionLog
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/decisions", tags=["Decision Log"])
 
-@router.get("/", response_model=List[DecisionLog])
+def _decision_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Shape a positional decision_log row (DECISION*_SQL column order) like the
+    DecisionLog schema without Pydantic validation.
+    """
+    decision_id, issue_id, decision_type, decision_reason, confidence_at_decision, decided_at = row
+    return {
+        "decision_id": str(decision_id),
+        "issue_id": str(issue_id),
+        "decision_type": decision_type,
+        "decision_reason": decision_reason,
+        "confidence_at_decision": confidence_at_decision,
+        "decided_at": decided_at
+    }
+
+@router.get("/", response_class=RecordJSONResponse, responses={200: {"model": List[DecisionLog]}})
+@cached_response("decisions")
 async def get_all_decisions(
-    limit: Optional[int] = Query(100, description="Maximum number of records to return"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     decision_type: Optional[str] = Query(None, description="Filter by decision type")
 ):
     """
@@ -23,46 +43,20 @@ async def get_all_decisions(
     
     Returns decisions ordered by decision time (most recent first).
     """
-    base_query = """
-    SELECT 
-        decision_id,
-        issue_id,
-        decision_type,
-        decision_reason,
-        confidence_at_decision,
-        decided_at
-    FROM decision_log 
-    """
-    
-    params = []
-    if decision_type:
-        base_query += "WHERE decision_type = %s "
-        params.append(decision_type)
-    
-    base_query += "ORDER BY decided_at DESC LIMIT %s"
-    params.append(limit)
+    query = DECISIONS_LIST_SQL[(bool(decision_type),)]
+    params = (decision_type, limit) if decision_type else (limit,)
     
     try:
-        results = db.execute_read_query(base_query, tuple(params))
-        logger.info(f"Retrieved {len(results)} decision log records")
-        
-        # Convert results to match Pydantic model
-        decisions = []
-        for row in results:
-            decision = DecisionLog(
-                decision_id=str(row['decision_id']),
-                issue_id=str(row['issue_id']),
-                decision_type=row['decision_type'],
-                decision_reason=row['decision_reason'],
-                confidence_at_decision=row['confidence_at_decision'],
-                decided_at=row['decided_at']
-            )
-            decisions.append(decision)
+        body, count = await db.consume_stream(
+            query, params, lambda rows: encode_records(map(_decision_to_dict, rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d decision log records", count)
         
-        return decisions
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving decision log records: {e}")
+        logger.error("Error retrieving decision log records: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve decision log records from database"
@@ -70,84 +64,57 @@ async def get_all_decisions(
 
 @router.get("/{decision_id}", response_model=DecisionLog)
 async def get_decision_by_id(
-    decision_id: str = Path(..., description="Unique identifier of the decision")
+    decision_id: int = Path(..., ge=1, description="Unique identifier of the decision")
 ):
     """
     Retrieve specific decision by ID.
     """
-    query = """
-    SELECT 
-        decision_id,
-        issue_id,
-        decision_type,
-        decision_reason,
-        confidence_at_decision,
-        decided_at
-    FROM decision_log 
-    WHERE decision_id = %s
-    """
-    
     try:
-        results = db.execute_read_query(query, (decision_id,))
+        row = await db.fetch_one(DECISION_BY_ID_SQL, (decision_id,))
         
-        if not results:
+        if row is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No decision found with ID {decision_id}"
             )
         
-        logger.info(f"Retrieved decision {decision_id}")
-        return DecisionLog(**results[0])
+        logger.info("Retrieved decision %s", decision_id)
+        return DecisionLog.model_construct(
+            decision_id=str(row['decision_id']),
+            issue_id=str(row['issue_id']),
+            decision_type=row['decision_type'],
+            decision_reason=row['decision_reason'],
+            confidence_at_decision=row['confidence_at_decision'],
+            decided_at=row['decided_at']
+        )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving decision {decision_id}: {e}")
+        logger.error("Error retrieving decision %s: %s", decision_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve decision from database"
         )
 
-@router.get("/issue/{issue_id}", response_model=List[DecisionLog])
+@router.get("/issue/{issue_id}", response_class=RecordJSONResponse, responses={200: {"model": List[DecisionLog]}})
 async def get_decisions_by_issue(
-    issue_id: str = Path(..., description="Issue identifier")
+    issue_id: int = Path(..., ge=1, description="Issue identifier")
 ):
     """
     Retrieve all decisions for a specific issue.
     """
-    query = """
-    SELECT 
-        decision_id,
-        issue_id,
-        decision_type,
-        decision_reason,
-        confidence_at_decision,
-        decided_at
-    FROM decision_log 
-    WHERE issue_id = %s
-    ORDER BY decided_at DESC
-    """
-    
     try:
-        results = db.execute_read_query(query, (issue_id,))
-        logger.info(f"Retrieved {len(results)} decisions for issue {issue_id}")
-        
-        decisions = []
-        for row in results:
-            decision = DecisionLog(
-                decision_id=str(row['decision_id']),
-                issue_id=str(row['issue_id']),
-                decision_type=row['decision_type'],
-                decision_reason=row['decision_reason'],
-                confidence_at_decision=row['confidence_at_decision'],
-                decided_at=row['decided_at']
-            )
-            decisions.append(decision)
+        body, count = await db.consume_stream(
+            DECISIONS_BY_ISSUE_SQL, (issue_id,), lambda rows: encode_records(map(_decision_to_dict, rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d decisions for issue %s", count, issue_id)
         
-        return decisions
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving decisions for issue {issue_id}: {e}")
+        logger.error("Error retrieving decisions for issue %s: %s", issue_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve decision records from database"
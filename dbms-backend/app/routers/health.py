@@ -5,14 +5,57 @@ Provides system health and database connectivity status.
 
 from fastapi import APIRouter, HTTPException
 from datetime import datetime
+from typing import Any, Dict
+import asyncio
+import time
 import logging
 
 from ..database.connection import db
+from ..database.queries import HEALTH_PING_SQL
 from ..models.schemas import HealthCheck
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Probe results are shared for this long so bursts of health checks
+# (liveness, readiness, load balancer) cost one pooled connection.
+PROBE_TTL_SECONDS = 1.0
+
+_probe_state: Dict[str, Any] = {
+    "checked_at": float("-inf"),
+    "connected": False,
+    "response_time_ms": None,
+    "error": None,
+}
+_probe_lock = asyncio.Lock()
+
+async def _probe_database() -> Dict[str, Any]:
+    """
+    Run the database ping at most once per PROBE_TTL_SECONDS.
+    Concurrent callers wait on the in-flight probe instead of starting their own.
+    """
+    if time.monotonic() - _probe_state["checked_at"] < PROBE_TTL_SECONDS:
+        return _probe_state
+    
+    async with _probe_lock:
+        if time.monotonic() - _probe_state["checked_at"] < PROBE_TTL_SECONDS:
+            return _probe_state
+        
+        try:
+            start_ns = time.perf_counter_ns()
+            await db.fetch_all(HEALTH_PING_SQL)
+            _probe_state.update(
+                connected=True,
+                response_time_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+                error=None
+            )
+        except Exception as e:
+            logger.warning("Database health check failed: %s", e)
+            _probe_state.update(connected=False, response_time_ms=None, error=str(e))
+        
+        _probe_state["checked_at"] = time.monotonic()
+        return _probe_state
+
 @router.get("/", response_model=HealthCheck)
 async def get_health_status():
     """
@@ -20,15 +63,8 @@ async def get_health_status():
     
     Returns API status and database connectivity information.
     """
-    try:
-        # Test database connection
-        test_query = "SELECT 1 as test"
-        db.execute_read_query(test_query)
-        database_connected = True
-        
-    except Exception as e:
-        logger.warning(f"Database health check failed: {e}")
-        database_connected = False
+    probe = await _probe_database()
+    database_connected = probe["connected"]
     
     return HealthCheck(
         status="healthy" if database_connected else "degraded",
@@ -43,30 +79,22 @@ async def get_database_health():
     
     Returns database connection status and basic performance metrics.
     """
-    try:
-        # Test database connection with timing
-        start_time = datetime.utcnow()
-        test_query = "SELECT 1 as test, NOW() as db_time"
-        result = db.execute_read_query(test_query)
-        end_time = datetime.utcnow()
-        
-        response_time_ms = (end_time - start_time).total_seconds() * 1000
-        
-        return {
-            "status": "connected",
-            "database_stats": {
-                "response_time_ms": round(response_time_ms, 2)
-            },
-            "timestamp": datetime.utcnow().isoformat()
-        }
-        
-    except Exception as e:
-        logger.exception(f"Database health check failed: {e}")
+    probe = await _probe_database()
+    
+    if not probe["connected"]:
         raise HTTPException(
             status_code=503,
             detail={
                 "database_status": "disconnected",
-                "error": str(e),
+                "error": probe["error"],
                 "timestamp": datetime.utcnow().isoformat()
             }
-        )
\ No newline at end of file
+        )
+    
+    return {
+        "status": "connected",
+        "database_stats": {
+            "response_time_ms": round(probe["response_time_ms"], 2)
+        },
+        "timestamp": datetime.utcnow().isoformat()
+    }
\ No newline at end of file
@@ -4,16 +4,36 @@ Provides read-only access to detected issues and related analysis data.
 """
 
 from fastapi import APIRouter, HTTPException, Path
-from typing import List
+from fastapi.responses import Response
+from typing import Any, Dict, List, Sequence
 import logging
 
 from ..database.connection import db
-from ..models.schemas import DetectedIssue, IssueAnalysis, IssueDecision
+from ..database.queries import ISSUES_ALL_SQL, ISSUE_ANALYSIS_SQL, ISSUE_DECISION_SQL, ISSUE_OVERVIEW_SQL
+from ..database.response_cache import cached_response
+from ..models.responses import RecordJSONResponse, encode_records
+from ..models.schemas import DetectedIssue, IssueAnalysis, IssueDecision, IssueOverview
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/issues", tags=["Issues"])
 
-@router.get("/", response_model=List[DetectedIssue])
+def _issue_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Shape a positional detected_issues row (ISSUES_ALL_SQL column order) like the
+    DetectedIssue schema without Pydantic validation.
+    """
+    issue_id, issue_type, detection_source, raw_metric_value, raw_metric_unit, detected_at = row
+    return {
+        "issue_id": str(issue_id),
+        "issue_type": issue_type,
+        "detection_source": detection_source,
+        "raw_metric_value": raw_metric_value,
+        "raw_metric_unit": raw_metric_unit,
+        "detected_at": detected_at
+    }
+
+@router.get("/", response_class=RecordJSONResponse, responses={200: {"model": List[DetectedIssue]}})
+@cached_response("issues")
 async def get_detected_issues():
     """
     Retrieve all detected issues from DBMS monitoring systems.
@@ -21,41 +41,18 @@ async def get_detected_issues():
     Returns issues ordered by detection time (most recent first).
     Query joins detection metadata for comprehensive issue view.
     """
-    query = """
-    SELECT 
-        issue_id,
-        issue_type,
-        detection_source,
-        raw_metric_value,
-        raw_metric_unit,
-        detected_at
-    FROM detected_issues 
-    WHERE detected_at IS NOT NULL
-    ORDER BY detected_at DESC
-    LIMIT 100
-    """
-    
     try:
-        results = db.execute_read_query(query)
-        logger.info(f"Retrieved {len(results)} detected issues")
-        
-        # Convert results to match Pydantic model
-        issues = []
-        for row in results:
-            issue = DetectedIssue(
-                issue_id=str(row['issue_id']),
-                issue_type=row['issue_type'],
-                detection_source=row['detection_source'],
-                raw_metric_value=float(row['raw_metric_value']) if row['raw_metric_value'] is not None else None,
-                raw_metric_unit=row['raw_metric_unit'],
-                detected_at=row['detected_at']
-            )
-            issues.append(issue)
+        # Encode rows as they stream off the cursor; skip re-validating trusted DB output
+        body, count = await db.consume_stream(
+            ISSUES_ALL_SQL, None, lambda rows: encode_records(map(_issue_to_dict, rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d detected issues", count)
         
-        return issues
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving detected issues: {e}")
+        logger.error("Error retrieving detected issues: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve detected issues from database"
@@ -63,7 +60,7 @@ async def get_detected_issues():
 
 @router.get("/{issue_id}/analysis", response_model=IssueAnalysis)
 async def get_issue_analysis(
-    issue_id: str = Path(..., description="Unique identifier of the issue")
+    issue_id: int = Path(..., ge=1, description="Unique identifier of the issue")
 ):
     """
     Retrieve AI analysis results for a specific issue.
@@ -71,35 +68,22 @@ async def get_issue_analysis(
     Returns the most recent analysis if multiple analyses exist.
     Analysis includes AI predictions, severity assessment, and confidence scores.
     """
-    query = """
-    SELECT 
-        issue_id,
-        predicted_issue_class,
-        severity_level,
-        confidence_score,
-        analyzed_at
-    FROM ai_analysis 
-    WHERE issue_id = %s
-    ORDER BY analyzed_at DESC
-    LIMIT 1
-    """
-    
     try:
-        results = db.execute_read_query(query, (issue_id,))
+        row = await db.fetch_one(ISSUE_ANALYSIS_SQL, (issue_id,))
         
-        if not results:
+        if row is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No analysis found for issue {issue_id}"
             )
         
-        logger.info(f"Retrieved analysis for issue {issue_id}")
-        return IssueAnalysis(**results[0])
+        logger.info("Retrieved analysis for issue %s", issue_id)
+        return IssueAnalysis.model_construct(**{**row, 'issue_id': str(row['issue_id'])})
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving analysis for issue {issue_id}: {e}")
+        logger.error("Error retrieving analysis for issue %s: %s", issue_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve issue analysis from database"
@@ -107,7 +91,7 @@ async def get_issue_analysis(
 
 @router.get("/{issue_id}/decision", response_model=IssueDecision)
 async def get_issue_decision(
-    issue_id: str = Path(..., description="Unique identifier of the issue")
+    issue_id: int = Path(..., ge=1, description="Unique identifier of the issue")
 ):
     """
     Retrieve decision made for a specific issue.
@@ -115,35 +99,78 @@ async def get_issue_decision(
     Returns the most recent decision if multiple decisions exist.
     Decision includes resolution strategy, rationale, and decision metadata.
     """
-    query = """
-    SELECT 
-        issue_id,
-        decision_type,
-        decision_reason,
-        decided_at
-    FROM decision_log 
-    WHERE issue_id = %s
-    ORDER BY decided_at DESC
-    LIMIT 1
-    """
-    
     try:
-        results = db.execute_read_query(query, (issue_id,))
+        row = await db.fetch_one(ISSUE_DECISION_SQL, (issue_id,))
         
-        if not results:
+        if row is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No decision found for issue {issue_id}"
             )
         
-        logger.info(f"Retrieved decision for issue {issue_id}")
-        return IssueDecision(**results[0])
+        logger.info("Retrieved decision for issue %s", issue_id)
+        return IssueDecision.model_construct(**{**row, 'issue_id': str(row['issue_id'])})
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving decision for issue {issue_id}: {e}")
+        logger.error("Error retrieving decision for issue %s: %s", issue_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve issue decision from database"
-        )
\ No newline at end of file
+        )
+
+@router.get("/{issue_id}/full", response_model=IssueOverview)
+async def get_issue_overview(
+    issue_id: int = Path(..., ge=1, description="Unique identifier of the issue")
+):
+    """
+    Retrieve an issue with its latest analysis and decision in one query.
+    
+    Replaces calling /issues/{issue_id}/analysis and /issues/{issue_id}/decision
+    separately after loading the issue.
+    """
+    try:
+        row = await db.fetch_one(ISSUE_OVERVIEW_SQL, (issue_id,))
+        
+        if row is None:
+            raise HTTPException(
+                status_code=404, 
+                detail=f"No issue found with ID {issue_id}"
+            )
+        
+        issue_key = str(row['issue_id'])
+        logger.info("Retrieved overview for issue %s", issue_id)
+        
+        return IssueOverview.model_construct(
+            issue=DetectedIssue.model_construct(
+                issue_id=issue_key,
+                issue_type=row['issue_type'],
+                detection_source=row['detection_source'],
+                raw_metric_value=row['raw_metric_value'],
+                raw_metric_unit=row['raw_metric_unit'],
+                detected_at=row['detected_at']
+            ),
+            latest_analysis=IssueAnalysis.model_construct(
+                issue_id=issue_key,
+                predicted_issue_class=row['predicted_issue_class'],
+                severity_level=row['severity_level'],
+                confidence_score=row['confidence_score'],
+                analyzed_at=row['analyzed_at']
+            ) if row['analysis_id'] is not None else None,
+            latest_decision=IssueDecision.model_construct(
+                issue_id=issue_key,
+                decision_type=row['decision_type'],
+                decision_reason=row['decision_reason'],
+                decided_at=row['decided_at']
+            ) if row['decision_id'] is not None else None
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error retrieving overview for issue %s: %s", issue_id, e)
+        raise HTTPException(
+            status_code=500, 
+            detail="Failed to retrieve issue overview from database"
+        )
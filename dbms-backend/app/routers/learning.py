@@ -4,18 +4,42 @@ Provides read-only access to learning history data.
 """
 
 from fastapi import APIRouter, HTTPException, Path, Query
-from typing import List, Optional
+from fastapi.responses import Response
+from typing import Any, Dict, List, Optional, Sequence
+from datetime import datetime
 import logging
 
 from ..database.connection import db
+from ..database.queries import LEARNING_BY_ID_SQL, LEARNING_LIST_SQL, LEARNING_STATS_SQL
+from ..database.response_cache import cached_response
+from ..models.responses import RecordJSONResponse, encode_records
 from ..models.schemas import LearningHistory
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/learning", tags=["Learning History"])
 
-@router.get("/", response_model=List[LearningHistory])
+def _learning_to_dict(row: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Shape a positional learning_history row (LEARNING_*_SQL column order) like the
+    LearningHistory schema without Pydantic validation.
+    """
+    (learning_id, decision_id, issue_type, action_type, outcome,
+     confidence_before, confidence_after, recorded_at) = row
+    return {
+        "learning_id": str(learning_id),
+        "decision_id": str(decision_id),
+        "issue_type": issue_type,
+        "action_type": action_type,
+        "outcome": outcome,
+        "confidence_before": confidence_before,
+        "confidence_after": confidence_after,
+        "recorded_at": recorded_at
+    }
+
+@router.get("/", response_class=RecordJSONResponse, responses={200: {"model": List[LearningHistory]}})
+@cached_response("learning")
 async def get_all_learning_history(
-    limit: Optional[int] = Query(100, description="Maximum number of records to return"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     issue_type: Optional[str] = Query(None, description="Filter by issue type"),
     outcome: Optional[str] = Query(None, description="Filter by outcome")
 ):
@@ -24,59 +48,20 @@ async def get_all_learning_history(
     
     Returns learning records ordered by recorded time (most recent first).
     """
-    base_query = """
-    SELECT 
-        learning_id,
-        decision_id,
-        issue_type,
-        action_type,
-        outcome,
-        confidence_before,
-        confidence_after,
-        recorded_at
-    FROM learning_history 
-    """
-    
-    params = []
-    conditions = []
-    
-    if issue_type:
-        conditions.append("issue_type = %s")
-        params.append(issue_type)
-    
-    if outcome:
-        conditions.append("outcome = %s")
-        params.append(outcome)
-    
-    if conditions:
-        base_query += "WHERE " + " AND ".join(conditions) + " "
-    
-    base_query += "ORDER BY recorded_at DESC LIMIT %s"
-    params.append(limit)
+    query = LEARNING_LIST_SQL[(bool(issue_type), bool(outcome))]
+    params = tuple(value for value in (issue_type, outcome) if value) + (limit,)
     
     try:
-        results = db.execute_read_query(base_query, tuple(params))
-        logger.info(f"Retrieved {len(results)} learning history records")
-        
-        # Convert results to match Pydantic model
-        learning_records = []
-        for row in results:
-            record = LearningHistory(
-                learning_id=str(row['learning_id']),
-                decision_id=str(row['decision_id']),
-                issue_type=row['issue_type'],
-                action_type=row['action_type'],
-                outcome=row['outcome'],
-                confidence_before=row['confidence_before'],
-                confidence_after=row['confidence_after'],
-                recorded_at=row['recorded_at']
-            )
-            learning_records.append(record)
+        body, count = await db.consume_stream(
+            query, params, lambda rows: encode_records(map(_learning_to_dict, rows)),
+            dictionary=False
+        )
+        logger.info("Retrieved %d learning history records", count)
         
-        return learning_records
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Error retrieving learning history records: {e}")
+        logger.error("Error retrieving learning history records: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve learning history records from database"
@@ -84,91 +69,63 @@ async def get_all_learning_history(
 
 @router.get("/{learning_id}", response_model=LearningHistory)
 async def get_learning_record_by_id(
-    learning_id: str = Path(..., description="Unique identifier of the learning record")
+    learning_id: int = Path(..., ge=1, description="Unique identifier of the learning record")
 ):
     """
     Retrieve specific learning record by ID.
     """
-    query = """
-    SELECT 
-        learning_id,
-        decision_id,
-        issue_type,
-        action_type,
-        outcome,
-        confidence_before,
-        confidence_after,
-        recorded_at
-    FROM learning_history 
-    WHERE learning_id = %s
-    """
-    
     try:
-        results = db.execute_read_query(query, (learning_id,))
+        row = await db.fetch_one(LEARNING_BY_ID_SQL, (learning_id,))
         
-        if not results:
+        if row is None:
             raise HTTPException(
                 status_code=404, 
                 detail=f"No learning record found with ID {learning_id}"
             )
         
-        logger.info(f"Retrieved learning record {learning_id}")
-        return LearningHistory(**results[0])
+        logger.info("Retrieved learning record %s", learning_id)
+        return LearningHistory.model_construct(
+            learning_id=str(row['learning_id']),
+            decision_id=str(row['decision_id']),
+            issue_type=row['issue_type'],
+            action_type=row['action_type'],
+            outcome=row['outcome'],
+            confidence_before=row['confidence_before'],
+            confidence_after=row['confidence_after'],
+            recorded_at=row['recorded_at']
+        )
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving learning record {learning_id}: {e}")
+        logger.error("Error retrieving learning record %s: %s", learning_id, e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve learning record from database"
         )
 
-@router.get("/stats/improvement", response_model=dict)
+@router.get("/stats/improvement", response_class=RecordJSONResponse)
+@cached_response("learning", ttl=60)
 async def get_learning_improvement_stats():
     """
     Get learning improvement statistics.
-    """
-    query = """
-    SELECT 
-        issue_type,
-        action_type,
-        COUNT(*) as total_records,
-        AVG(confidence_before) as avg_confidence_before,
-        AVG(confidence_after) as avg_confidence_after,
-        AVG(confidence_after - confidence_before) as avg_improvement,
-        SUM(CASE WHEN outcome = 'RESOLVED' THEN 1 ELSE 0 END) as successful_outcomes
-    FROM learning_history 
-    GROUP BY issue_type, action_type
-    ORDER BY avg_improvement DESC
-    """
     
+    Aggregated live from learning_history; the response cache holds the
+    result for 60 seconds, so polling clients share one GROUP BY per minute.
+    """
     try:
-        results = db.execute_read_query(query)
-        logger.info(f"Retrieved learning improvement stats for {len(results)} combinations")
-        
-        stats = []
-        for row in results:
-            stat = {
-                "issue_type": row['issue_type'],
-                "action_type": row['action_type'],
-                "total_records": row['total_records'],
-                "avg_confidence_before": float(row['avg_confidence_before']) if row['avg_confidence_before'] else 0,
-                "avg_confidence_after": float(row['avg_confidence_after']) if row['avg_confidence_after'] else 0,
-                "avg_improvement": float(row['avg_improvement']) if row['avg_improvement'] else 0,
-                "successful_outcomes": row['successful_outcomes'],
-                "success_rate": (row['successful_outcomes'] / row['total_records']) * 100 if row['total_records'] > 0 else 0
-            }
-            stats.append(stat)
+        results = await db.fetch_all(LEARNING_STATS_SQL)
+        logger.info("Retrieved learning improvement stats for %d combinations", len(results))
         
-        return {
-            "learning_stats": stats,
-            "total_combinations": len(stats),
-            "timestamp": db.execute_read_query("SELECT NOW() as timestamp")[0]['timestamp'].isoformat()
-        }
+        # Rows already hold native ints/floats from SQL; encode them directly
+        return RecordJSONResponse({
+            "learning_stats": results,
+            "total_combinations": len(results),
+            "timestamp": datetime.utcnow().isoformat()
+        })
         
     except Exception as e:
-        logger.error(f"Error retrieving learning improvement stats: {e}")
+        logger.error("Error retrieving learning improvement stats: %s", e)
         raise HTTPException(
             status_code=500, 
             detail="Failed to retrieve learning improvement statistics"
@@ -6,11 +6,12 @@ This module contains the complete rule set for DBMS issue resolution.
 All rules are hardcoded, explicit, and academically defensible.
 """
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, NamedTuple, Optional
-from decimal import Decimal
+from functools import lru_cache
+from typing import Callable, Dict, Optional
 
-class IssueType(Enum):
+class IssueType(str, Enum):
     """
     Supported DBMS issue types.
     Each type maps to specific detection sources and resolution strategies.
@@ -21,7 +22,7 @@ class IssueType(Enum):
     TRANSACTION_FAILURE = "TRANSACTION_FAILURE"
     LOCK_WAIT = "LOCK_WAIT"
 
-class DecisionType(Enum):
+class DecisionType(str, Enum):
     """
     Decision types for issue resolution.
     Determines whether system can auto-heal or requires human intervention.
@@ -30,7 +31,7 @@ class DecisionType(Enum):
     ADMIN_REVIEW = "ADMIN_REVIEW"
     ESCALATED = "ESCALATED"
 
-class ActionType(Enum):
+class ActionType(str, Enum):
     """
     Healing action types.
     All actions are SIMULATED for safety - no real DB mutations.
@@ -41,7 +42,7 @@ class ActionType(Enum):
     KILL_CONNECTION = "KILL_CONNECTION"  # SIMULATED ONLY
     OPTIMIZE_QUERY = "OPTIMIZE_QUERY"    # RECOMMENDATION ONLY
 
-class ExecutionMode(Enum):
+class ExecutionMode(str, Enum):
     """
     Execution modes for healing actions.
     """
@@ -49,7 +50,7 @@ class ExecutionMode(Enum):
     MANUAL = "MANUAL"
     SIMULATED = "SIMULATED"
 
-class ExecutionStatus(Enum):
+class ExecutionStatus(str, Enum):
     """
     Status of healing action execution.
     """
@@ -58,7 +59,8 @@ class ExecutionStatus(Enum):
     PENDING = "PENDING"
     SIMULATED = "SIMULATED"
 
-class HealingRule(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class HealingRule:
     """
     Represents a single healing rule.
     Immutable structure for deterministic rule application.
@@ -68,9 +70,77 @@ class HealingRule(NamedTuple):
     action_type: ActionType
     execution_mode: ExecutionMode
     reason: str
-    confidence: Decimal
+    confidence: float
     conditions: Optional[Dict] = None
 
+# Issue types by value, so lookups skip Enum construction and its ValueError on unknown types
+_ISSUE_BY_NAME: Dict[str, IssueType] = {member.value: member for member in IssueType}
+
+def _condition_predicate(conditions: Dict) -> Callable[[Dict], bool]:
+    """
+    Build the check for a conditional rule, specialized to the conditions it declares.
+    
+    Args:
+        conditions: The rule's conditions (max_retries, timeout_threshold)
+        
+    Returns:
+        Function taking the context (retry counts, timeouts, etc.) and returning
+        True if conditions are met, False otherwise
+    """
+    max_retries = conditions.get('max_retries')
+    timeout_threshold = conditions.get('timeout_threshold')
+    
+    if max_retries is None and timeout_threshold is None:
+        return lambda context: True
+    if timeout_threshold is None:
+        return lambda context: context.get('retry_count', 0) < max_retries
+    if max_retries is None:
+        return lambda context: context.get('timeout_seconds', 0) <= timeout_threshold
+    return lambda context: (
+        context.get('retry_count', 0) < max_retries
+        and context.get('timeout_seconds', 0) <= timeout_threshold
+    )
+
+# Escalation rules are immutable, so one instance per issue type is shared by every lookup
+@lru_cache(maxsize=128)
+def _unknown_issue_rule(issue_type: str) -> HealingRule:
+    """Escalation rule for an unsupported issue type."""
+    return HealingRule(
+        issue_type=issue_type,
+        decision_type=DecisionType.ADMIN_REVIEW,
+        action_type=ActionType.NONE,
+        execution_mode=ExecutionMode.MANUAL,
+        reason=f"Unknown issue type '{issue_type}' requires manual analysis",
+        confidence=1.00,
+        conditions=None
+    )
+
+@lru_cache(maxsize=128)
+def _conditions_not_met_rule(issue_type: str, issue_enum: IssueType) -> HealingRule:
+    """Escalation rule for a conditional rule whose conditions failed."""
+    return HealingRule(
+        issue_type=issue_enum,
+        decision_type=DecisionType.ADMIN_REVIEW,
+        action_type=ActionType.NONE,
+        execution_mode=ExecutionMode.MANUAL,
+        reason=f"Conditions not met for auto-healing {issue_type}",
+        confidence=1.00,
+        conditions=None
+    )
+
+@lru_cache(maxsize=128)
+def _no_rule_defined_rule(issue_type: str, issue_enum: IssueType) -> HealingRule:
+    """Escalation rule for a supported issue type missing from the rule set."""
+    return HealingRule(
+        issue_type=issue_enum,
+        decision_type=DecisionType.ADMIN_REVIEW,
+        action_type=ActionType.NONE,
+        execution_mode=ExecutionMode.MANUAL,
+        reason=f"No rule defined for issue type '{issue_type}'",
+        confidence=1.00,
+        conditions=None
+    )
+
 class HealingRulebook:
     """
     Official DBMS Self-Healing Rulebook.
@@ -93,7 +163,7 @@ class HealingRulebook:
             action_type=ActionType.ROLLBACK_TRANSACTION,
             execution_mode=ExecutionMode.SIMULATED,
             reason="InnoDB already chooses deadlock victim; rollback is safe and deterministic",
-            confidence=Decimal('0.95'),
+            confidence=0.95,
             conditions=None
         ),
         
@@ -104,7 +174,7 @@ class HealingRulebook:
             action_type=ActionType.NONE,
             execution_mode=ExecutionMode.MANUAL,
             reason="Slow queries require query analysis, index optimization, or schema redesign",
-            confidence=Decimal('1.00'),
+            confidence=1.00,
             conditions=None
         ),
         
@@ -115,7 +185,7 @@ class HealingRulebook:
             action_type=ActionType.NONE,
             execution_mode=ExecutionMode.MANUAL,
             reason="Connection limits require capacity planning; killing connections may break applications",
-            confidence=Decimal('1.00'),
+            confidence=1.00,
             conditions=None
         ),
         
@@ -126,7 +196,7 @@ class HealingRulebook:
             action_type=ActionType.RETRY_OPERATION,
             execution_mode=ExecutionMode.SIMULATED,
             reason="Transient transaction failures can be safely retried with exponential backoff",
-            confidence=Decimal('0.80'),
+            confidence=0.80,
             conditions={'max_retries': MAX_RETRY_COUNT}
         ),
         
@@ -137,11 +207,19 @@ class HealingRulebook:
             action_type=ActionType.RETRY_OPERATION,
             execution_mode=ExecutionMode.SIMULATED,
             reason="Short lock waits can be retried; long waits indicate design issues",
-            confidence=Decimal('0.70'),
+            confidence=0.70,
             conditions={'timeout_threshold': LOCK_WAIT_TIMEOUT_THRESHOLD}
         ),
     ]
     
+    # Dispatch table from issue type value to (rule, condition predicate or None)
+    _DISPATCH = {
+        rule.issue_type.value: (rule, _condition_predicate(rule.conditions) if rule.conditions else None)
+        for rule in RULES
+    }
+    _AUTO_HEAL_COUNT = sum(1 for rule in RULES if rule.decision_type == DecisionType.AUTO_HEAL)
+    _ADMIN_REVIEW_COUNT = sum(1 for rule in RULES if rule.decision_type == DecisionType.ADMIN_REVIEW)
+    
     @classmethod
     def get_rule_for_issue(cls, issue_type: str, context: Optional[Dict] = None) -> Optional[HealingRule]:
         """
@@ -157,78 +235,24 @@ class HealingRulebook:
         Raises:
             ValueError: If issue_type is not supported
         """
-        try:
-            issue_enum = IssueType(issue_type.upper())
-        except ValueError:
-            # Unknown issue type - escalate to admin
-            return HealingRule(
-                issue_type=issue_type,
-                decision_type=DecisionType.ADMIN_REVIEW,
-                action_type=ActionType.NONE,
-                execution_mode=ExecutionMode.MANUAL,
-                reason=f"Unknown issue type '{issue_type}' requires manual analysis",
-                confidence=Decimal('1.00'),
-                conditions=None
-            )
-        
-        # Find matching rule
-        for rule in cls.RULES:
-            if rule.issue_type == issue_enum:
-                # Check conditions for conditional rules
-                if rule.conditions and context:
-                    if not cls._check_conditions(rule, context):
-                        # Conditions not met - escalate to admin
-                        return HealingRule(
-                            issue_type=issue_enum,
-                            decision_type=DecisionType.ADMIN_REVIEW,
-                            action_type=ActionType.NONE,
-                            execution_mode=ExecutionMode.MANUAL,
-                            reason=f"Conditions not met for auto-healing {issue_type}",
-                            confidence=Decimal('1.00'),
-                            conditions=None
-                        )
-                
-                return rule
-        
-        # No rule found - should not happen with complete rulebook
-        return HealingRule(
-            issue_type=issue_enum,
-            decision_type=DecisionType.ADMIN_REVIEW,
-            action_type=ActionType.NONE,
-            execution_mode=ExecutionMode.MANUAL,
-            reason=f"No rule defined for issue type '{issue_type}'",
-            confidence=Decimal('1.00'),
-            conditions=None
-        )
-    
-    @classmethod
-    def _check_conditions(cls, rule: HealingRule, context: Dict) -> bool:
-        """
-        Check if conditions are met for conditional rules.
-        
-        Args:
-            rule: The healing rule to check
-            context: Context data (retry counts, timeouts, etc.)
+        entry = cls._DISPATCH.get(issue_type) or cls._DISPATCH.get(issue_type.upper())
+        if entry is None:
+            issue_enum = _ISSUE_BY_NAME.get(issue_type.upper())
+            if issue_enum is None:
+                # Unknown issue type - escalate to admin
+                return _unknown_issue_rule(issue_type)
             
-        Returns:
-            True if conditions are met, False otherwise
-        """
-        if not rule.conditions:
-            return True
+            # No rule found - should not happen with complete rulebook
+            return _no_rule_defined_rule(issue_type, issue_enum)
         
-        # Check retry count conditions
-        if 'max_retries' in rule.conditions:
-            retry_count = context.get('retry_count', 0)
-            if retry_count >= rule.conditions['max_retries']:
-                return False
+        rule, predicate = entry
         
-        # Check timeout conditions
-        if 'timeout_threshold' in rule.conditions:
-            timeout = context.get('timeout_seconds', 0)
-            if timeout > rule.conditions['timeout_threshold']:
-                return False
+        # Check conditions for conditional rules
+        if context and predicate is not None and not predicate(context):
+            # Conditions not met - escalate to admin
+            return _conditions_not_met_rule(issue_type, rule.issue_type)
         
-        return True
+        return rule
     
     @classmethod
     def get_all_supported_issue_types(cls) -> list[str]:
@@ -245,8 +269,8 @@ class HealingRulebook:
         """
         summary = {
             'total_rules': len(cls.RULES),
-            'auto_heal_rules': len([r for r in cls.RULES if r.decision_type == DecisionType.AUTO_HEAL]),
-            'admin_review_rules': len([r for r in cls.RULES if r.decision_type == DecisionType.ADMIN_REVIEW]),
+            'auto_heal_rules': cls._AUTO_HEAL_COUNT,
+            'admin_review_rules': cls._ADMIN_REVIEW_COUNT,
             'supported_issue_types': cls.get_all_supported_issue_types(),
             'rules_by_type': {}
         }
@@ -254,11 +278,11 @@ class HealingRulebook:
         for rule in cls.RULES:
             issue_type = rule.issue_type.value
             summary['rules_by_type'][issue_type] = {
-                'decision_type': rule.decision_type.value,
-                'action_type': rule.action_type.value,
-                'execution_mode': rule.execution_mode.value,
+                'decision_type': rule.decision_type,
+                'action_type': rule.action_type,
+                'execution_mode': rule.execution_mode,
                 'reason': rule.reason,
-                'confidence': float(rule.confidence),
+                'confidence': rule.confidence,
                 'has_conditions': rule.conditions is not None
             }
         
@@ -272,22 +296,22 @@ def validate_rulebook():
     Raises:
         AssertionError: If rulebook validation fails
     """
-    issue_types = set(IssueType)
-    rule_types = set(rule.issue_type for rule in HealingRulebook.RULES)
+    rule_types = set()
     
-    # Ensure all issue types have rules
-    missing_rules = issue_types - rule_types
-    assert not missing_rules, f"Missing rules for issue types: {missing_rules}"
-    
-    # Ensure all rules have valid confidence scores
     for rule in HealingRulebook.RULES:
+        rule_types.add(rule.issue_type)
+        
+        # Ensure all rules have valid confidence scores
         assert 0 <= rule.confidence <= 1, f"Invalid confidence for {rule.issue_type}: {rule.confidence}"
-    
-    # Ensure AUTO_HEAL rules are safe (simulated only)
-    for rule in HealingRulebook.RULES:
+        
+        # Ensure AUTO_HEAL rules are safe (simulated only)
         if rule.decision_type == DecisionType.AUTO_HEAL:
             assert rule.execution_mode == ExecutionMode.SIMULATED, \
                 f"AUTO_HEAL rule for {rule.issue_type} must be SIMULATED, got {rule.execution_mode}"
+    
+    # Ensure all issue types have rules
+    missing_rules = set(IssueType) - rule_types
+    assert not missing_rules, f"Missing rules for issue types: {missing_rules}"
 
 # Validate rulebook on import
 validate_rulebook()
\ No newline at end of file
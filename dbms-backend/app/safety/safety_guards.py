@@ -6,14 +6,18 @@ This module implements hard safety guards that prevent any unsafe
 database operations, ensuring academic and production safety.
 """
 
+import copy
 import logging
 import re
-from typing import List, Dict, Any, Optional
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import List, Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from enum import Enum
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
-class SafetyViolationType(Enum):
+class SafetyViolationType(str, Enum):
     """Types of safety violations that can be detected."""
     DANGEROUS_SQL = "DANGEROUS_SQL"
     UNSAFE_ACTION = "UNSAFE_ACTION"
@@ -31,6 +35,28 @@ class SafetyViolation(Exception):
         self.context = context or {}
         super().__init__(f"SAFETY VIOLATION [{violation_type.value}]: {message}")
 
+# SQL injection patterns, scanned together with the dangerous keywords
+_INJECTION_PATTERNS = (
+    r";\s*(DROP|DELETE|TRUNCATE|ALTER)",
+    r"UNION\s+SELECT",
+    r"--\s*$",
+    r"/\*.*\*/",
+    r"'\s*OR\s*'",
+    r"'\s*AND\s*'"
+)
+
+# Keyword arguments SafetyDecorator.prevent_os_commands treats as OS commands
+_OS_COMMAND_PARAMS = ('command', 'cmd', 'shell_command', 'os_command')
+
+# Operations validate_sql_query allows when none are given
+_DEFAULT_READ_OPERATIONS = ('SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN')
+
+# Direct execution operations that must go through the simulated healing path
+_FORBIDDEN_DIRECT_OPERATIONS = frozenset([
+    'DIRECT_ROLLBACK', 'DIRECT_KILL', 'DIRECT_RESTART',
+    'DIRECT_FLUSH', 'DIRECT_RESET', 'DIRECT_SHUTDOWN'
+])
+
 class SafetyGuards:
     """
     Comprehensive safety guard system for DBMS self-healing.
@@ -44,25 +70,44 @@ class SafetyGuards:
     """
     
     # Dangerous SQL keywords that should never be executed directly
-    DANGEROUS_SQL_KEYWORDS = [
+    DANGEROUS_SQL_KEYWORDS = frozenset([
         'DROP', 'DELETE', 'TRUNCATE', 'ALTER', 'CREATE',
         'KILL', 'SHUTDOWN', 'RESTART', 'FLUSH', 'RESET',
         'GRANT', 'REVOKE', 'SET GLOBAL', 'SET SESSION',
         'LOAD DATA', 'SELECT INTO OUTFILE', 'LOAD_FILE'
-    ]
+    ])
+    
+    # Single case-insensitive scan for whole-word dangerous keywords and injection patterns.
+    # Injection patterns are zero-width lookaheads so they never consume a keyword
+    # (";\s*DROP" must still report DROP).
+    _DENY_RE = re.compile(
+        r'(?P<keyword>\b(?:'
+        + '|'.join(re.escape(k) for k in sorted(DANGEROUS_SQL_KEYWORDS, key=lambda k: (-len(k), k)))
+        + r')\b)|'
+        + '|'.join(f'(?=(?P<p{i}>{pattern}))' for i, pattern in enumerate(_INJECTION_PATTERNS)),
+        re.IGNORECASE
+    )
     
     # Dangerous action types that require special handling
-    DANGEROUS_ACTIONS = [
+    DANGEROUS_ACTIONS = frozenset([
         'KILL_CONNECTION', 'ROLLBACK_TRANSACTION', 'RETRY_OPERATION',
         'RESTART_SERVICE', 'FLUSH_TABLES', 'RESET_SLAVE'
-    ]
+    ])
+    
+    # Authorized write operations per table
+    _AUTHORIZED_WRITES: Mapping[str, FrozenSet[str]] = MappingProxyType({
+        'decision_log': frozenset({'INSERT'}),
+        'healing_actions': frozenset({'INSERT'}),
+        'admin_reviews': frozenset({'INSERT', 'UPDATE'}),
+        'learning_history': frozenset({'INSERT'})
+    })
     
     # OS commands that should never be executed
-    DANGEROUS_OS_COMMANDS = [
+    DANGEROUS_OS_COMMANDS = frozenset([
         'rm', 'del', 'format', 'fdisk', 'mkfs', 'dd',
         'kill', 'killall', 'pkill', 'shutdown', 'reboot',
         'systemctl', 'service', 'net stop', 'net start'
-    ]
+    ])
     
     @classmethod
     def validate_sql_query(cls, query: str, allowed_operations: List[str] = None) -> None:
@@ -83,45 +128,13 @@ class SafetyGuards:
                 {'query': query}
             )
         
-        query_upper = query.strip().upper()
-        allowed_operations = allowed_operations or ['SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN']
-        
-        # Check if query starts with allowed operation
-        if not any(query_upper.startswith(op) for op in allowed_operations):
-            raise SafetyViolation(
-                SafetyViolationType.DANGEROUS_SQL,
-                f"Query must start with one of: {', '.join(allowed_operations)}",
-                {'query': query[:100], 'allowed_operations': allowed_operations}
-            )
-        
-        # Check for dangerous keywords
-        for keyword in cls.DANGEROUS_SQL_KEYWORDS:
-            if keyword in query_upper:
-                raise SafetyViolation(
-                    SafetyViolationType.DANGEROUS_SQL,
-                    f"Query contains dangerous keyword: {keyword}",
-                    {'query': query[:100], 'dangerous_keyword': keyword}
-                )
-        
-        # Check for SQL injection patterns
-        injection_patterns = [
-            r";\s*(DROP|DELETE|TRUNCATE|ALTER)",
-            r"UNION\s+SELECT",
-            r"--\s*$",
-            r"/\*.*\*/",
-            r"'\s*OR\s*'",
-            r"'\s*AND\s*'"
-        ]
-        
-        for pattern in injection_patterns:
-            if re.search(pattern, query_upper):
-                raise SafetyViolation(
-                    SafetyViolationType.DANGEROUS_SQL,
-                    f"Query contains potential SQL injection pattern",
-                    {'query': query[:100], 'pattern': pattern}
-                )
+        # Repeated queries reuse the cached scan result
+        violation = _find_sql_violation(query, tuple(allowed_operations or _DEFAULT_READ_OPERATIONS))
+        if violation is not None:
+            message, context = violation
+            raise SafetyViolation(SafetyViolationType.DANGEROUS_SQL, message, copy.deepcopy(context))
         
-        logger.debug(f"SQL query validated as safe: {query[:50]}...")
+        logger.debug("SQL query validated as safe: %.50s...", query)
     
     @classmethod
     def validate_healing_action(cls, action_type: str, execution_mode: str, context: Dict[str, Any] = None) -> None:
@@ -136,15 +149,13 @@ class SafetyGuards:
         Raises:
             SafetyViolation: If action is unsafe
         """
-        context = context or {}
-        
         # All dangerous actions must be simulated
         if action_type in cls.DANGEROUS_ACTIONS:
             if execution_mode != 'SIMULATED':
                 raise SafetyViolation(
                     SafetyViolationType.UNSAFE_ACTION,
                     f"Dangerous action '{action_type}' must be SIMULATED, got '{execution_mode}'",
-                    {'action_type': action_type, 'execution_mode': execution_mode, 'context': context}
+                    {'action_type': action_type, 'execution_mode': execution_mode, 'context': context or {}}
                 )
         
         # Specific action validations
@@ -157,14 +168,14 @@ class SafetyGuards:
                 )
         
         elif action_type == 'ROLLBACK_TRANSACTION':
-            if execution_mode not in ['SIMULATED', 'MANUAL']:
+            if execution_mode not in ('SIMULATED', 'MANUAL'):
                 raise SafetyViolation(
                     SafetyViolationType.UNSAFE_ACTION,
                     "Transaction rollback must be simulated or manual only",
                     {'action_type': action_type, 'execution_mode': execution_mode}
                 )
         
-        logger.debug(f"Healing action validated as safe: {action_type} ({execution_mode})")
+        logger.debug("Healing action validated as safe: %s (%s)", action_type, execution_mode)
     
     @classmethod
     def validate_database_write(cls, operation: str, table: str, context: Dict[str, Any] = None) -> None:
@@ -179,30 +190,20 @@ class SafetyGuards:
         Raises:
             SafetyViolation: If write operation is unauthorized
         """
-        context = context or {}
-        
-        # Define authorized write operations
-        authorized_writes = {
-            'decision_log': ['INSERT'],
-            'healing_actions': ['INSERT'],
-            'admin_reviews': ['INSERT', 'UPDATE'],
-            'learning_history': ['INSERT']
-        }
-        
         # Check if table allows writes
-        if table not in authorized_writes:
+        if table not in cls._AUTHORIZED_WRITES:
             raise SafetyViolation(
                 SafetyViolationType.UNAUTHORIZED_WRITE,
                 f"Write operations not authorized for table: {table}",
-                {'operation': operation, 'table': table, 'context': context}
+                {'operation': operation, 'table': table, 'context': context or {}}
             )
         
         # Check if operation is allowed for this table
-        if operation not in authorized_writes[table]:
+        if operation not in cls._AUTHORIZED_WRITES[table]:
             raise SafetyViolation(
                 SafetyViolationType.UNAUTHORIZED_WRITE,
                 f"Operation '{operation}' not authorized for table '{table}'",
-                {'operation': operation, 'table': table, 'authorized': authorized_writes[table]}
+                {'operation': operation, 'table': table, 'authorized': sorted(cls._AUTHORIZED_WRITES[table])}
             )
         
         # Never allow writes to detected_issues (read-only)
@@ -213,7 +214,7 @@ class SafetyGuards:
                 {'operation': operation, 'table': table}
             )
         
-        logger.debug(f"Database write validated as authorized: {operation} on {table}")
+        logger.debug("Database write validated as authorized: %s on %s", operation, table)
     
     @classmethod
     def validate_os_command(cls, command: str, context: Dict[str, Any] = None) -> None:
@@ -230,7 +231,7 @@ class SafetyGuards:
         raise SafetyViolation(
             SafetyViolationType.OS_COMMAND,
             f"OS command execution is strictly forbidden: {command}",
-            {'command': command, 'context': context or {}}
+            {'command': command, 'dangerous_command': _dangerous_os_command(command), 'context': context or {}}
         )
     
     @classmethod
@@ -245,19 +246,14 @@ class SafetyGuards:
         Raises:
             SafetyViolation: If direct execution is attempted
         """
-        forbidden_operations = [
-            'DIRECT_ROLLBACK', 'DIRECT_KILL', 'DIRECT_RESTART',
-            'DIRECT_FLUSH', 'DIRECT_RESET', 'DIRECT_SHUTDOWN'
-        ]
-        
-        if operation in forbidden_operations:
+        if operation in _FORBIDDEN_DIRECT_OPERATIONS:
             raise SafetyViolation(
                 SafetyViolationType.DIRECT_EXECUTION,
                 f"Direct execution forbidden: {operation}",
                 {'operation': operation, 'context': context or {}}
             )
         
-        logger.debug(f"Direct execution check passed: {operation}")
+        logger.debug("Direct execution check passed: %s", operation)
     
     @classmethod
     def create_safety_report(cls) -> Dict[str, Any]:
@@ -267,37 +263,96 @@ class SafetyGuards:
         Returns:
             Dictionary containing safety configuration and status
         """
-        return {
-            'timestamp': logger.handlers[0].formatter.formatTime(logger.makeRecord(
-                'safety', logging.INFO, __file__, 0, '', (), None
-            )) if logger.handlers else 'unknown',
-            'safety_guards_active': True,
-            'dangerous_sql_keywords': len(cls.DANGEROUS_SQL_KEYWORDS),
-            'dangerous_actions': len(cls.DANGEROUS_ACTIONS),
-            'dangerous_os_commands': len(cls.DANGEROUS_OS_COMMANDS),
-            'protection_levels': {
-                'sql_injection_protection': True,
-                'dangerous_keyword_blocking': True,
-                'action_execution_validation': True,
-                'os_command_blocking': True,
-                'unauthorized_write_prevention': True,
-                'direct_execution_prevention': True
-            },
-            'authorized_operations': {
-                'sql_read_operations': ['SELECT', 'SHOW', 'DESCRIBE', 'EXPLAIN'],
-                'authorized_write_tables': ['decision_log', 'healing_actions', 'admin_reviews', 'learning_history'],
-                'forbidden_write_tables': ['detected_issues', 'ai_analysis'],
-                'simulation_only_actions': cls.DANGEROUS_ACTIONS
-            },
-            'safety_guarantees': [
-                'No direct database mutations on detected_issues',
-                'All dangerous actions are simulated only',
-                'No OS command execution allowed',
-                'SQL injection protection active',
-                'Unauthorized write operations blocked',
-                'Connection termination simulated only'
-            ]
-        }
+        # Deep copy so callers that modify a report cannot change later ones
+        return {'timestamp': datetime.now().isoformat(), **copy.deepcopy(_SAFETY_REPORT)}
+
+# Static part of the safety report; only the timestamp changes between reports
+_SAFETY_REPORT: Dict[str, Any] = {
+    'safety_guards_active': True,
+    'dangerous_sql_keywords': len(SafetyGuards.DANGEROUS_SQL_KEYWORDS),
+    'dangerous_actions': len(SafetyGuards.DANGEROUS_ACTIONS),
+    'dangerous_os_commands': len(SafetyGuards.DANGEROUS_OS_COMMANDS),
+    'protection_levels': {
+        'sql_injection_protection': True,
+        'dangerous_keyword_blocking': True,
+        'action_execution_validation': True,
+        'os_command_blocking': True,
+        'unauthorized_write_prevention': True,
+        'direct_execution_prevention': True
+    },
+    'authorized_operations': {
+        'sql_read_operations': list(_DEFAULT_READ_OPERATIONS),
+        'authorized_write_tables': ['decision_log', 'healing_actions', 'admin_reviews', 'learning_history'],
+        'forbidden_write_tables': ['detected_issues', 'ai_analysis'],
+        'simulation_only_actions': sorted(SafetyGuards.DANGEROUS_ACTIONS)
+    },
+    'safety_guarantees': [
+        'No direct database mutations on detected_issues',
+        'All dangerous actions are simulated only',
+        'No OS command execution allowed',
+        'SQL injection protection active',
+        'Unauthorized write operations blocked',
+        'Connection termination simulated only'
+    ]
+}
+
+def _dangerous_os_command(command: Any) -> Optional[str]:
+    """Return the known dangerous OS command a command line starts with, if any."""
+    if not isinstance(command, str):
+        return None
+    
+    # Two-word commands ('net stop') are checked before the head token
+    words = command.lower().split(None, 2)
+    if len(words) > 1 and f"{words[0]} {words[1]}" in SafetyGuards.DANGEROUS_OS_COMMANDS:
+        return f"{words[0]} {words[1]}"
+    if words and words[0] in SafetyGuards.DANGEROUS_OS_COMMANDS:
+        return words[0]
+    return None
+
+@lru_cache(maxsize=32)
+def _allowed_prefix_re(allowed_operations: Tuple[str, ...]) -> re.Pattern:
+    """Compile a case-insensitive match for a query starting with one of the allowed operations."""
+    return re.compile(
+        r'\s*(?:' + '|'.join(re.escape(op) for op in allowed_operations) + r')\b',
+        re.IGNORECASE
+    )
+
+@lru_cache(maxsize=4096)
+def _find_sql_violation(query: str, allowed_operations: Tuple[str, ...]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Scan a SQL query for safety violations.
+    
+    Returns:
+        (message, context) for the first violation found, or None if the query is safe.
+        Results are cached, so callers must copy the context before handing it out.
+    """
+    # Check if query starts with allowed operation
+    if not _allowed_prefix_re(allowed_operations).match(query):
+        return (
+            f"Query must start with one of: {', '.join(allowed_operations)}",
+            {'query': query[:100], 'allowed_operations': list(allowed_operations)}
+        )
+    
+    # Check for dangerous keywords and SQL injection patterns in one pass;
+    # any keyword is reported ahead of an injection pattern
+    injection = None
+    for match in SafetyGuards._DENY_RE.finditer(query):
+        if match.lastgroup == 'keyword':
+            keyword = match.group().upper()
+            return (
+                f"Query contains dangerous keyword: {keyword}",
+                {'query': query[:100], 'dangerous_keyword': keyword}
+            )
+        if injection is None:
+            injection = match
+    
+    if injection is not None:
+        return (
+            "Query contains potential SQL injection pattern",
+            {'query': query[:100], 'pattern': _INJECTION_PATTERNS[int(injection.lastgroup[1:])]}
+        )
+    
+    return None
 
 class SafetyDecorator:
     """
@@ -313,12 +368,13 @@ class SafetyDecorator:
             allowed_operations: List of allowed SQL operations
         """
         def decorator(func):
-            def wrapper(*args, **kwargs):
-                # Look for 'query' parameter
+            @wraps(func)
+            def wrapper(*args, _ops=allowed_operations, **kwargs):
+                # Look for 'query' parameter, then a positional query string
                 if 'query' in kwargs:
-                    SafetyGuards.validate_sql_query(kwargs['query'], allowed_operations)
-                elif len(args) > 0 and isinstance(args[0], str):
-                    SafetyGuards.validate_sql_query(args[0], allowed_operations)
+                    SafetyGuards.validate_sql_query(kwargs['query'], _ops)
+                elif args and args[0].__class__ is str:
+                    SafetyGuards.validate_sql_query(args[0], _ops)
                 
                 return func(*args, **kwargs)
             return wrapper
@@ -329,12 +385,13 @@ class SafetyDecorator:
         """
         Decorator to validate healing actions in function arguments.
         """
+        @wraps(func)
         def wrapper(*args, **kwargs):
             if 'action_type' in kwargs and 'execution_mode' in kwargs:
                 SafetyGuards.validate_healing_action(
                     kwargs['action_type'], 
                     kwargs['execution_mode'],
-                    kwargs.get('context', {})
+                    kwargs.get('context')
                 )
             
             return func(*args, **kwargs)
@@ -345,10 +402,10 @@ class SafetyDecorator:
         """
         Decorator to prevent any OS command execution.
         """
+        @wraps(func)
         def wrapper(*args, **kwargs):
             # Check for common OS command parameters
-            dangerous_params = ['command', 'cmd', 'shell_command', 'os_command']
-            for param in dangerous_params:
+            for param in _OS_COMMAND_PARAMS:
                 if param in kwargs:
                     SafetyGuards.validate_os_command(kwargs[param])
             
@@ -377,33 +434,33 @@ def enforce_safety_check(operation_type: str, **kwargs) -> None:
         SafetyGuards.validate_healing_action(
             kwargs.get('action_type', ''),
             kwargs.get('execution_mode', ''),
-            kwargs.get('context', {})
+            kwargs.get('context')
         )
     
     elif operation_type == 'database_write':
         SafetyGuards.validate_database_write(
             kwargs.get('operation', ''),
             kwargs.get('table', ''),
-            kwargs.get('context', {})
+            kwargs.get('context')
         )
     
     elif operation_type == 'os_command':
         SafetyGuards.validate_os_command(
             kwargs.get('command', ''),
-            kwargs.get('context', {})
+            kwargs.get('context')
         )
     
     elif operation_type == 'direct_execution':
         SafetyGuards.validate_direct_execution(
             kwargs.get('operation', ''),
-            kwargs.get('context', {})
+            kwargs.get('context')
         )
     
     else:
-        logger.warning(f"Unknown safety check operation type: {operation_type}")
+        logger.warning("Unknown safety check operation type: %s", operation_type)
 
 # Initialize safety guards on module import
 logger.info("DBMS Safety Guards initialized - All dangerous operations blocked")
-logger.info(f"Protected against {len(SafetyGuards.DANGEROUS_SQL_KEYWORDS)} dangerous SQL keywords")
-logger.info(f"Protected against {len(SafetyGuards.DANGEROUS_ACTIONS)} dangerous actions")
-logger.info(f"Protected against {len(SafetyGuards.DANGEROUS_OS_COMMANDS)} dangerous OS commands")
\ No newline at end of file
+logger.info("Protected against %d dangerous SQL keywords", len(SafetyGuards.DANGEROUS_SQL_KEYWORDS))
+logger.info("Protected against %d dangerous actions", len(SafetyGuards.DANGEROUS_ACTIONS))
+logger.info("Protected against %d dangerous OS commands", len(SafetyGuards.DANGEROUS_OS_COMMANDS))
\ No newline at end of file
@@ -1,26 +1,72 @@
 import mysql.connector
 import os
+import threading
 import time
 from datetime import datetime
 
 class DBProbe:
+    # Issue-related tables cleared by clear_state
+    CLEAR_TABLES = (
+        'learning_history', 'healing_actions', 'admin_reviews',
+        'decision_log', 'ai_analysis', 'detected_issues', 'debug_log'
+    )
+
     def __init__(self):
         self.config = {
             'host': os.getenv('DB_HOST', '127.0.0.1'),
             'user': os.getenv('DB_USER', 'root'),
             'password': os.getenv('DB_PASSWORD', 'Tsr@2007'),
             'database': os.getenv('DB_NAME', 'dbms_self_healing'),
-            'autocommit': True
+            'autocommit': True,
+            'consume_results': True
         }
+        self._local = threading.local()
 
     def get_connection(self):
-        return mysql.connector.connect(**self.config)
+        """
+        Connection for the current thread, opened once and reused across probe calls.
+        Scenario threads each get their own, so concurrent load still uses separate sessions.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = mysql.connector.connect(**self.config)
+            self._local.conn = conn
+        return conn
+
+    def _reconnect_if_dropped(self, conn):
+        """
+        Called after a failed statement. Returns True if the connection had been
+        dropped and was reopened, so the caller can retry; False if the error
+        came from the statement itself.
+        """
+        if conn.is_connected():
+            return False
+        conn.reconnect()
+        return True
+
+    def close_connection(self):
+        """Close the current thread's probe connection, if one is open."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            return
+        self._local.conn = None
+        try:
+            conn.close()
+        except mysql.connector.Error:
+            pass
 
     def run_query(self, sql, params=None):
         conn = self.get_connection()
         cursor = conn.cursor(dictionary=True, buffered=True)
         try:
-            cursor.execute(sql, params or ())
+            try:
+                cursor.execute(sql, params or ())
+            except mysql.connector.Error:
+                if not self._reconnect_if_dropped(conn):
+                    raise
+                cursor.close()
+                cursor = conn.cursor(dictionary=True, buffered=True)
+                cursor.execute(sql, params or ())
             res = None
             if cursor.with_rows:
                 res = cursor.fetchall()
@@ -34,20 +80,25 @@ class DBProbe:
             return res
         finally:
             cursor.close()
-            conn.close()
 
     def call_procedure(self, proc_name, params=None):
         conn = self.get_connection()
         cursor = conn.cursor(buffered=True)
         try:
-            cursor.callproc(proc_name, params or [])
+            try:
+                cursor.callproc(proc_name, params or [])
+            except mysql.connector.Error:
+                if not self._reconnect_if_dropped(conn):
+                    raise
+                cursor.close()
+                cursor = conn.cursor(buffered=True)
+                cursor.callproc(proc_name, params or [])
             # Consume all result sets to prevent "Unread result found"
             for result in cursor.stored_results():
                 result.fetchall()
             conn.commit()
         finally:
             cursor.close()
-            conn.close()
 
     def get_last_issue(self):
         return self.run_query("SELECT * FROM detected_issues ORDER BY issue_id DESC LIMIT 1")
@@ -63,11 +114,7 @@ class DBProbe:
 
     def clear_state(self):
         """Clears all issue related tables for a clean audit run."""
-        tables = [
-            'learning_history', 'healing_actions', 'admin_reviews', 
-            'decision_log', 'ai_analysis', 'detected_issues', 'debug_log'
-        ]
         self.run_query("SET FOREIGN_KEY_CHECKS = 0")
-        for table in tables:
+        for table in self.CLEAR_TABLES:
             self.run_query(f"TRUNCATE TABLE {table}")
         self.run_query("SET FOREIGN_KEY_CHECKS = 1")
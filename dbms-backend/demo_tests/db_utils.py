@@ -1,5 +1,6 @@
 import mysql.connector
 import os
+import threading
 import time
 from datetime import datetime
 
@@ -17,50 +18,89 @@ def get_connection():
         user=os.getenv('DB_USER', 'root'),
         password=os.getenv('DB_PASSWORD', 'Tsr@2007'),
         database=os.getenv('DB_NAME', 'dbms_self_healing'),
-        autocommit=True
+        autocommit=True,
+        consume_results=True
     )
 
-def run_query(sql, params=None):
-    conn = get_connection()
-    cursor = conn.cursor()
+# Issue-related tables cleared by reset_system_state (order is important due to FKs)
+RESET_TABLES = (
+    'failure_log', 'execution_context', 'execution_queue',
+    'healing_actions', 'admin_reviews', 'decision_log',
+    'ai_analysis', 'detected_issues', 'debug_log'
+)
+
+_local = threading.local()
+
+def _shared_connection():
+    """
+    Connection reused by the query helpers on the current thread, so each helper
+    call skips the connect/auth handshake.
+    """
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = get_connection()
+        _local.conn = conn
+    return conn
+
+def _execute(sql, params=None, dictionary=False):
+    """
+    Run a statement on the shared connection and return its cursor. The connection
+    is only checked when a statement fails: if it was dropped (reset_system_state
+    kills other sessions), reconnect and retry once.
+    """
+    conn = _shared_connection()
+    cursor = conn.cursor(dictionary=dictionary)
     try:
         cursor.execute(sql, params or ())
-        conn.commit()
+    except mysql.connector.Error:
+        if conn.is_connected():
+            cursor.close()
+            raise
+        conn.reconnect()
+        cursor = conn.cursor(dictionary=dictionary)
+        cursor.execute(sql, params or ())
+    return cursor
+
+def close_connection():
+    """Close the current thread's shared connection, if one is open."""
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        return
+    _local.conn = None
+    try:
+        conn.close()
+    except mysql.connector.Error:
+        pass
+
+def run_query(sql, params=None):
+    cursor = _execute(sql, params)
+    try:
+        _shared_connection().commit()
     finally:
         cursor.close()
-        conn.close()
 
 def insert_and_get_id(sql, params=None):
-    conn = get_connection()
-    cursor = conn.cursor()
+    cursor = _execute(sql, params)
     try:
-        cursor.execute(sql, params or ())
-        conn.commit()
+        _shared_connection().commit()
         return cursor.lastrowid
     finally:
         cursor.close()
-        conn.close()
 
 def fetch_one(sql, params=None):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    cursor = _execute(sql, params, dictionary=True)
     try:
-        cursor.execute(sql, params or ())
         rows = cursor.fetchall()
         return rows[0] if rows else None
     finally:
         cursor.close()
-        conn.close()
 
 def fetch_all(sql, params=None):
-    conn = get_connection()
-    cursor = conn.cursor(dictionary=True)
+    cursor = _execute(sql, params, dictionary=True)
     try:
-        cursor.execute(sql, params or ())
         return cursor.fetchall()
     finally:
         cursor.close()
-        conn.close()
 
 def print_section(title):
     print(f"\n{Colors.CYAN}{'='*60}")
@@ -79,20 +119,21 @@ def reset_system_state():
         except:
             pass
             
-    # 2. Truncate tables (order is important due to FKs)
+    # 2. Truncate tables
     log_step("Clearing all monitoring and decision history...", "INFO")
-    tables = [
-        'failure_log', 'execution_context', 'execution_queue', 
-        'healing_actions', 'admin_reviews', 'decision_log', 
-        'ai_analysis', 'detected_issues', 'debug_log'
-    ]
-    run_query("SET FOREIGN_KEY_CHECKS = 0")
-    for table in tables:
-        try:
-            run_query(f"TRUNCATE TABLE {table}")
-        except:
-            pass
-    run_query("SET FOREIGN_KEY_CHECKS = 1")
+    # FOREIGN_KEY_CHECKS is per session, so every TRUNCATE must run on the connection that disabled it
+    conn = _shared_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        for table in RESET_TABLES:
+            try:
+                cursor.execute(f"TRUNCATE TABLE `{table}`")
+            except:
+                pass
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+    finally:
+        cursor.close()
     log_step("System reset complete.", "PASS")
 
 def trigger_self_healing(issue_id):
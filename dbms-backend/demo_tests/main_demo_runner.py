@@ -4,7 +4,7 @@ import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from demo_tests.db_utils import print_section, Colors, reset_system_state
+from demo_tests.db_utils import print_section, Colors, reset_system_state, close_connection
 from demo_tests.scenarios.slow_query_test import run_slow_query_test
 from demo_tests.scenarios.deadlock_test import run_deadlock_test
 from demo_tests.scenarios.overload_test import run_overload_test
@@ -54,4 +54,7 @@ def main():
     print("\n")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        close_connection()
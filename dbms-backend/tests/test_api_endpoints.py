@@ -5,12 +5,17 @@ Tests basic functionality without requiring database connection
 import pytest
 import sys
 import os
+from contextlib import closing
+from datetime import datetime
+from decimal import Decimal
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from fastapi.testclient import TestClient
 from app.main import app
+from app.database import response_cache
+from app.database.connection import db
 
 client = TestClient(app)
 
@@ -70,3 +75,158 @@ def test_api_version_format():
     version = data.get('version', '')
     # Check version format (e.g., "1.0.0")
     assert len(version.split('.')) >= 2, "Version should follow semantic versioning"
+
+def test_large_responses_gzipped():
+    """Test that responses over 1KB are gzip-compressed when the client accepts it"""
+    response = client.get('/openapi.json', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers.get('content-encoding') == 'gzip'
+    small = client.get('/', headers={'Accept-Encoding': 'gzip'})
+    assert 'content-encoding' not in small.headers
+
+def _stub_decision_rows(monkeypatch):
+    """Serve 50 decision rows (well over the gzip threshold) without a database"""
+    response_cache.clear()
+
+    def fake_stream(query, params=None, dictionary=True):
+        return closing((i, i, 'AUTO_HEAL', 'Deadlock victim rolled back', 0.95, '2024-01-01T00:00:00') for i in range(50))
+
+    monkeypatch.setattr(db, 'stream_read_query', fake_stream)
+
+def test_cached_endpoint_gzipped_repeatedly(monkeypatch):
+    """Test a cached list endpoint decodes correctly on every gzip request, not just the first"""
+    _stub_decision_rows(monkeypatch)
+    bodies = []
+    for _ in range(3):
+        response = client.get('/decisions/', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers.get('content-encoding') == 'gzip'
+        bodies.append(response.json())
+    assert len(bodies[0]) == 50
+    assert bodies[0] == bodies[1] == bodies[2]
+
+def test_cached_endpoint_repeated_without_gzip(monkeypatch):
+    """Test repeated uncompressed requests to a cached endpoint are not sent gzip headers"""
+    _stub_decision_rows(monkeypatch)
+    client.get('/decisions/', headers={'Accept-Encoding': 'gzip'})
+    for _ in range(2):
+        response = client.get('/decisions/', headers={'Accept-Encoding': 'identity'})
+        assert response.status_code == 200
+        assert 'content-encoding' not in response.headers
+        assert response.headers['content-length'] == str(len(response.content))
+        assert len(response.json()) == 50
+
+def test_admin_reviews_list_encoded_and_errors_surface(monkeypatch):
+    """Test admin reviews are encoded from the cursor and a failed read returns 500"""
+    row = {
+        'review_id': 1, 'decision_id': 2, 'issue_id': 3, 'review_status': 'PENDING',
+        'issue_type': 'SLOW_QUERY', 'action_type': 'ADMIN_REVIEW', 'admin_action': None,
+        'admin_comment': None, 'override_flag': 0, 'reviewed_at': None
+    }
+    monkeypatch.setattr(db, 'stream_read_query', lambda query, params=None, dictionary=True: closing(r for r in [row]))
+    response = client.get('/admin-reviews/?limit=5')
+    assert response.status_code == 200
+    assert response.json()[0]['review_id'] == '1'
+    assert response.json()[0]['override_flag'] is False
+
+    def failing_rows():
+        raise RuntimeError("connection lost")
+        yield
+
+    monkeypatch.setattr(db, 'stream_read_query', lambda query, params=None, dictionary=True: closing(failing_rows()))
+    assert client.get('/admin-reviews/?limit=5').status_code == 500
+
+def test_issue_overview_combines_latest_records(monkeypatch):
+    """Test /issues/{id}/full nests the issue, latest analysis and latest decision"""
+    row = {
+        'issue_id': 7, 'issue_type': 'DEADLOCK', 'detection_source': 'INNODB',
+        'raw_metric_value': Decimal('1'), 'raw_metric_unit': 'count', 'detected_at': datetime(2024, 1, 1),
+        'analysis_id': 3, 'predicted_issue_class': 'DEADLOCK', 'severity_level': 'HIGH',
+        'confidence_score': Decimal('0.9'), 'analyzed_at': datetime(2024, 1, 1, 0, 0, 1),
+        'decision_id': 4, 'decision_type': 'AUTO_HEAL', 'decision_reason': 'Rollback victim',
+        'decided_at': datetime(2024, 1, 1, 0, 0, 2)
+    }
+
+    async def fake_fetch_one(query, params=None):
+        return row
+
+    monkeypatch.setattr(db, 'fetch_one', fake_fetch_one)
+    response = client.get('/issues/7/full')
+    assert response.status_code == 200
+    data = response.json()
+    assert data['issue']['issue_id'] == '7'
+    assert data['latest_analysis']['severity_level'] == 'HIGH'
+    assert data['latest_decision']['decision_type'] == 'AUTO_HEAL'
+
+    row.update(analysis_id=None, decision_id=None)
+    data = client.get('/issues/7/full').json()
+    assert data['latest_analysis'] is None
+    assert data['latest_decision'] is None
+
+def test_issue_overview_missing_issue_returns_404(monkeypatch):
+    """Test /issues/{id}/full returns 404 when the issue does not exist"""
+    async def fake_fetch_one(query, params=None):
+        return None
+
+    monkeypatch.setattr(db, 'fetch_one', fake_fetch_one)
+    assert client.get('/issues/999/full').status_code == 404
+
+def test_analysis_by_id_reads_positional_row(monkeypatch):
+    """Test /analysis/{id} fetches a tuple row and shapes it in SELECT column order"""
+    calls = []
+
+    async def fake_fetch_one(query, params=None, dictionary=True):
+        calls.append(dictionary)
+        return (5, 7, 'DEADLOCK', 'HIGH', 'LOCK', Decimal('0.9'), 'v1', datetime(2024, 1, 1), None, Decimal('2.5'))
+
+    monkeypatch.setattr(db, 'fetch_one', fake_fetch_one)
+    response = client.get('/analysis/5')
+    assert response.status_code == 200
+    data = response.json()
+    assert data['analysis_id'] == '5'
+    assert data['issue_id'] == '7'
+    assert data['baseline_metric'] is None
+    assert data['severity_ratio'] == 2.5
+    assert calls == [False]
+
+def test_admin_reviews_limit_bounded():
+    """Test that oversized limits are rejected before touching the database"""
+    response = client.get('/admin-reviews/?limit=100000')
+    assert response.status_code == 422
+
+def test_list_limits_bounded():
+    """Test that list endpoints reject limits outside 1..1000"""
+    for endpoint in ['/analysis/', '/decisions/', '/learning/']:
+        for limit in (0, 1001):
+            response = client.get(f'{endpoint}?limit={limit}')
+            assert response.status_code == 422, f"Endpoint {endpoint} should reject limit={limit}"
+
+def test_malformed_ids_rejected():
+    """Test that non-numeric IDs are rejected with 422 instead of querying the database"""
+    for endpoint in ['/actions/not-an-id', '/admin-reviews/not-an-id', '/analysis/not-an-id',
+                     '/decisions/not-an-id', '/learning/not-an-id', '/issues/not-an-id/analysis',
+                     '/issues/0/decision', '/analysis/issue/-1']:
+        response = client.get(endpoint)
+        assert response.status_code == 422, f"Endpoint {endpoint} should reject malformed IDs"
+
+def test_health_probes_share_one_query(monkeypatch):
+    """Test concurrent health probes within the TTL run a single database ping"""
+    import asyncio
+    from app.routers import health
+
+    calls = []
+
+    async def fake_fetch_all(query, params=None):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return [{'test': 1}]
+
+    monkeypatch.setattr(health.db, 'fetch_all', fake_fetch_all)
+    monkeypatch.setitem(health._probe_state, 'checked_at', float('-inf'))
+
+    async def probe_many():
+        return await asyncio.gather(*(health._probe_database() for _ in range(10)))
+
+    results = asyncio.run(probe_many())
+    assert len(calls) == 1
+    assert all(result['connected'] for result in results)
@@ -0,0 +1,95 @@
+"""
+Test suite for the streaming read helpers of the database connection
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mysql.connector.errors import PoolError
+
+from app.database.connection import DatabaseConnection, RowStream
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetched = 0
+        self.closed = False
+
+    def fetchmany(self, size):
+        batch = self.rows[self.fetched:self.fetched + size]
+        self.fetched += len(batch)
+        return batch
+
+    def fetchall(self):
+        raise AssertionError("unread rows must be dropped, not fetched")
+
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.shut_down = False
+        self.disconnected = False
+
+    def close(self):
+        self.closed = True
+
+    def shutdown(self):
+        self.shut_down = True
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+class FakePool:
+    def __init__(self, idle):
+        self.idle = list(idle)
+
+    def get_connection(self):
+        if not self.idle:
+            raise PoolError("Failed getting connection; pool exhausted")
+        return self.idle.pop()
+
+
+def test_exhausted_stream_returns_connection():
+    """Test reading every row closes the cursor and returns the connection"""
+    cursor, conn = FakeCursor(range(5)), FakeConnection()
+    stream = RowStream(conn, cursor, batch_size=2)
+    assert list(stream) == [0, 1, 2, 3, 4]
+    assert cursor.closed and conn.closed
+    assert not conn.shut_down
+
+
+def test_close_before_iteration_releases_connection():
+    """Test a stream closed before its first row still releases the connection"""
+    cursor, conn = FakeCursor(range(5)), FakeConnection()
+    stream = RowStream(conn, cursor, batch_size=2)
+    stream.close()
+    stream.close()
+    assert conn.shut_down
+    assert cursor.fetched == 0
+    assert list(stream) == []
+
+
+def test_early_close_drops_unread_rows():
+    """Test leaving a with block mid-stream drops the connection without reading the rest"""
+    cursor, conn = FakeCursor(range(1000)), FakeConnection()
+    with RowStream(conn, cursor, batch_size=10) as stream:
+        assert next(stream) == 0
+    assert conn.shut_down
+    assert cursor.fetched == 10
+
+
+def test_close_disconnects_idle_pool_connections():
+    """Test closing the database disconnects every idle pooled connection once"""
+    idle = [FakeConnection() for _ in range(3)]
+    database = DatabaseConnection.__new__(DatabaseConnection)
+    database._pool = FakePool(idle)
+    database.close()
+    database.close()
+    assert all(conn.disconnected and not conn.closed for conn in idle)
+    assert database._pool is None
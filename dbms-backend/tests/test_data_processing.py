@@ -5,10 +5,13 @@ import pytest
 import sys
 import os
 from datetime import datetime
+from decimal import Decimal
+import json
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.main import serialize_datetime, process_results
+from app.models.responses import encode_records
 
 
 def test_serialize_datetime():
@@ -92,3 +95,23 @@ def test_process_results_mixed_types():
     assert processed[0]['float_field'] == 45.67
     assert isinstance(processed[0]['datetime_field'], str)
     assert processed[0]['none_field'] is None
+
+
+def test_encode_records_streams_json_array():
+    """Test records are encoded into a JSON array with Decimal and datetime values"""
+    records = iter([
+        {'id': '1', 'score': Decimal('0.9500'), 'at': datetime(2026, 3, 22, 10, 30, 45)},
+        {'id': '2', 'score': None, 'at': datetime(2026, 3, 22, 11, 0, 0)}
+    ])
+    body, count = encode_records(records)
+    assert count == 2
+    data = json.loads(body)
+    assert data[0] == {'id': '1', 'score': '0.9500', 'at': '2026-03-22T10:30:45'}
+    assert data[1]['score'] is None
+
+
+def test_encode_records_empty():
+    """Test encoding no records yields an empty JSON array"""
+    body, count = encode_records([])
+    assert body == b'[]'
+    assert count == 0
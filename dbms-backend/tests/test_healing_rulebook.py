@@ -0,0 +1,57 @@
+"""
+Test suite for the healing rulebook
+"""
+import sys
+import os
+
+import orjson
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.rules import HealingRulebook, IssueType, DecisionType
+
+
+def test_every_issue_type_resolves_to_its_rule():
+    """Test each supported issue type, in any case, returns its own rule"""
+    for issue_type in IssueType:
+        rule = HealingRulebook.get_rule_for_issue(issue_type.value.lower())
+        assert rule.issue_type is issue_type
+        assert rule in HealingRulebook.RULES
+
+
+def test_unknown_issue_type_escalates():
+    """Test unsupported issue types are sent to admin review"""
+    rule = HealingRulebook.get_rule_for_issue("DISK_FULL")
+    assert rule.decision_type == DecisionType.ADMIN_REVIEW
+    assert "DISK_FULL" in rule.reason
+
+
+def test_failed_conditions_escalate():
+    """Test conditional rules escalate once their thresholds are exceeded"""
+    retry = HealingRulebook.get_rule_for_issue("TRANSACTION_FAILURE", {"retry_count": 3})
+    lock_wait = HealingRulebook.get_rule_for_issue("LOCK_WAIT", {"timeout_seconds": 31})
+    assert retry.decision_type == DecisionType.ADMIN_REVIEW
+    assert lock_wait.decision_type == DecisionType.ADMIN_REVIEW
+    assert HealingRulebook.get_rule_for_issue("LOCK_WAIT", {"timeout_seconds": 5}).decision_type == DecisionType.AUTO_HEAL
+
+
+def test_rule_summary_counts():
+    """Test the summary counts match the rule set"""
+    summary = HealingRulebook.get_rule_summary()
+    assert summary['total_rules'] == len(HealingRulebook.RULES)
+    assert summary['auto_heal_rules'] == 3
+    assert summary['admin_review_rules'] == 2
+
+
+def test_escalation_rules_are_reused():
+    """Test repeated escalations return the same shared rule instance"""
+    first = HealingRulebook.get_rule_for_issue("DISK_FULL")
+    second = HealingRulebook.get_rule_for_issue("DISK_FULL")
+    assert first is second
+
+
+def test_rule_summary_is_json_serializable():
+    """Test the summary encodes with the API's JSON renderer"""
+    body = orjson.loads(orjson.dumps(HealingRulebook.get_rule_summary()))
+    assert body['rules_by_type']['DEADLOCK']['decision_type'] == 'AUTO_HEAL'
+    assert IssueType.DEADLOCK == 'DEADLOCK'
@@ -0,0 +1,80 @@
+"""
+Test suite for the read endpoint response cache
+"""
+import asyncio
+from contextlib import closing
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from app.database import response_cache
+from app.database.connection import db
+from app.database.response_cache import cached_response, invalidate
+from app.main import app
+
+
+def _counting_handler(namespace, ttl=5.0):
+    calls = []
+
+    @cached_response(namespace, ttl=ttl)
+    async def handler(limit=100):
+        calls.append(limit)
+        return {"limit": limit, "call": len(calls)}
+
+    return handler, calls
+
+
+def test_repeated_calls_hit_cache():
+    """Test identical calls within the TTL run the handler once"""
+    response_cache.clear()
+    handler, calls = _counting_handler("test_hits")
+    first = asyncio.run(handler(limit=10))
+    second = asyncio.run(handler(limit=10))
+    assert first == second
+    assert calls == [10]
+
+
+def test_different_arguments_are_cached_separately():
+    """Test query parameters are part of the cache key"""
+    response_cache.clear()
+    handler, calls = _counting_handler("test_keys")
+    asyncio.run(handler(limit=10))
+    asyncio.run(handler(limit=20))
+    assert calls == [10, 20]
+
+
+def test_expired_and_invalidated_entries_are_refreshed():
+    """Test expired entries and namespace invalidation force a fresh call"""
+    response_cache.clear()
+    handler, calls = _counting_handler("test_expiry", ttl=0)
+    asyncio.run(handler(limit=10))
+    asyncio.run(handler(limit=10))
+    assert calls == [10, 10]
+
+    handler, calls = _counting_handler("test_invalidate")
+    asyncio.run(handler(limit=10))
+    invalidate("test_invalidate")
+    asyncio.run(handler(limit=10))
+    assert calls == [10, 10]
+
+
+def test_cached_endpoint_served_twice_through_app(monkeypatch):
+    """Test a cached endpoint returns the same body on a miss and on a hit"""
+    response_cache.clear()
+    calls = []
+
+    def fake_stream(query, params=None, dictionary=True):
+        calls.append(params)
+        return closing((i, i, 'DEADLOCK', 'HIGH', 'LOCK', 0.9, 'v1', '2024-01-01T00:00:00', 1.0, 2.0) for i in range(20))
+
+    monkeypatch.setattr(db, 'stream_read_query', fake_stream)
+    client = TestClient(app)
+    first = client.get('/analysis/?limit=5')
+    second = client.get('/analysis/?limit=5')
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert len(first.json()) == 20
+    assert calls == [(5,)]
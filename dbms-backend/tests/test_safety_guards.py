@@ -0,0 +1,108 @@
+"""
+Test suite for the DBMS safety guards
+"""
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.safety import SafetyGuards, SafetyViolation
+
+
+def test_read_queries_pass():
+    """Test plain read queries validate, including columns that contain keywords"""
+    SafetyGuards.validate_sql_query("SELECT issue_id, created_at FROM detected_issues LIMIT 10")
+    SafetyGuards.validate_sql_query("  show tables")
+
+
+def test_first_keyword_in_query_is_reported():
+    """Test the keyword reported is the one that appears first in the query"""
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_sql_query("SELECT 1; TRUNCATE detected_issues; DROP TABLE decision_log")
+    assert exc_info.value.context['dangerous_keyword'] == 'TRUNCATE'
+
+
+def test_keywords_match_whole_words_only():
+    """Test keywords inside identifiers or glued to letters and digits are not blocked"""
+    SafetyGuards.validate_sql_query("SELECT created_at, is_deleted FROM detected_issues")
+    SafetyGuards.validate_sql_query("SELECT xDROPx, DROP2 FROM detected_issues")
+
+
+def test_versioned_comment_caught_by_comment_pattern():
+    """Test a keyword hidden in a MySQL versioned comment is blocked by the comment pattern"""
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_sql_query("SELECT /*!50000DROP*/ 1")
+    assert exc_info.value.context['pattern'] == r"/\*.*\*/"
+    assert 'dangerous_keyword' not in exc_info.value.context
+
+
+def test_dangerous_keyword_reported():
+    """Test dangerous keywords are blocked regardless of case"""
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_sql_query("SELECT 1; set global max_connections = 1")
+    assert exc_info.value.context['dangerous_keyword'] == 'SET GLOBAL'
+
+
+def test_injection_pattern_reported():
+    """Test injection patterns are blocked and the matching pattern is reported"""
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_sql_query("SELECT name FROM users WHERE id = 1 union select password FROM users")
+    assert exc_info.value.context['pattern'] == r"UNION\s+SELECT"
+
+
+def test_disallowed_operation_blocked():
+    """Test queries must start with an allowed operation"""
+    with pytest.raises(SafetyViolation):
+        SafetyGuards.validate_sql_query("INSERT INTO decision_log VALUES (1)")
+    SafetyGuards.validate_sql_query("INSERT INTO decision_log VALUES (1)", allowed_operations=['INSERT'])
+
+
+def test_cached_violation_raises_fresh_context():
+    """Test repeated failing queries each raise with their own context"""
+    query = "SELECT 1; DROP TABLE detected_issues"
+    with pytest.raises(SafetyViolation) as first:
+        SafetyGuards.validate_sql_query(query)
+    first.value.context['dangerous_keyword'] = 'changed'
+    with pytest.raises(SafetyViolation) as second:
+        SafetyGuards.validate_sql_query(query)
+    assert second.value.context['dangerous_keyword'] == 'DROP'
+
+
+def test_allowed_operation_must_be_whole_word():
+    """Test the leading operation is matched as a whole word"""
+    SafetyGuards.validate_sql_query("\n  explain SELECT 1")
+    with pytest.raises(SafetyViolation):
+        SafetyGuards.validate_sql_query("SHOWCASE")
+
+
+def test_database_write_authorization():
+    """Test writes are limited to the authorized table operations"""
+    SafetyGuards.validate_database_write('UPDATE', 'admin_reviews')
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_database_write('UPDATE', 'decision_log')
+    assert exc_info.value.context['authorized'] == ['INSERT']
+    with pytest.raises(SafetyViolation):
+        SafetyGuards.validate_database_write('INSERT', 'detected_issues')
+
+
+def test_os_commands_always_blocked():
+    """Test OS commands are rejected and known dangerous commands are identified"""
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_os_command("NET STOP mysql")
+    assert exc_info.value.context['dangerous_command'] == 'net stop'
+    with pytest.raises(SafetyViolation) as exc_info:
+        SafetyGuards.validate_os_command("ls -la")
+    assert exc_info.value.context['dangerous_command'] is None
+
+
+def test_safety_reports_are_independent():
+    """Test modifying one safety report does not leak into later reports"""
+    report = SafetyGuards.create_safety_report()
+    report['safety_guarantees'].append('changed')
+    report['protection_levels']['os_command_blocking'] = False
+    fresh = SafetyGuards.create_safety_report()
+    assert 'changed' not in fresh['safety_guarantees']
+    assert fresh['protection_levels']['os_command_blocking'] is True
+    assert fresh['safety_guarantees'] is not report['safety_guarantees']